@@ -35,7 +35,7 @@ from onshape_robotics_toolkit.log import LOGGER
 from onshape_robotics_toolkit.mesh import transform_mesh
 from onshape_robotics_toolkit.models.assembly import Assembly, RootAssembly
 from onshape_robotics_toolkit.models.document import BASE_URL, Document, DocumentMetaData, generate_url
-from onshape_robotics_toolkit.models.element import Element
+from onshape_robotics_toolkit.models.element import Element, decode_elements
 from onshape_robotics_toolkit.models.mass import MassProperties
 from onshape_robotics_toolkit.models.variable import Variable
 from onshape_robotics_toolkit.utilities.helpers import (
@@ -222,7 +222,7 @@ class Client:
             """
             raise ValueError(f"Access forbidden for document: {did}")
 
-        document = DocumentMetaData.model_validate(res.json())
+        document = DocumentMetaData.model_validate_json(res.content)
         document.name = get_sanitized_name(document.name)
 
         return document
@@ -247,9 +247,11 @@ class Client:
             ... )
             >>> print(elements)
             {
-                "wheelAndFork": Element(id='0b0c209535554345432581fe', name='wheelAndFork', elementType='PARTSTUDIO',
+                "wheelAndFork": Element(id='0b0c209535554345432581fe', name='wheelAndFork',
+                                         elementType=<ElementType.PARTSTUDIO: 'PARTSTUDIO'>,
                                          microversionId='9b3be6165c7a2b1f6dd61305'),
-                "frame": Element(id='0b0c209535554345432581fe', name='frame', elementType='PARTSTUDIO',
+                "frame": Element(id='0b0c209535554345432581fe', name='frame',
+                                 elementType=<ElementType.PARTSTUDIO: 'PARTSTUDIO'>,
                                  microversionId='9b3be6165c7a2b1f6dd61305')
             }
         """
@@ -269,7 +271,7 @@ class Client:
             LOGGER.error(f"Access forbidden for document: {did}")
             return {}
 
-        return {element["name"]: Element.model_validate(element) for element in response.json()}
+        return {element.name: element for element in decode_elements(response.content)}
 
     def get_variables(self, did: str, wid: str, eid: str) -> dict[str, Variable]:
         """
@@ -588,7 +590,7 @@ class Client:
             )
             exit(1)
 
-        assembly = Assembly.model_validate(res.json())
+        assembly = Assembly.model_validate_json(res.content)
         document = Document(did=did, wtype=wtype, wid=wid, eid=eid)
         assembly.document = document
 
@@ -808,7 +810,7 @@ class Client:
             )
             raise ValueError(f"Assembly: {url} does not have a mass property")
 
-        return MassProperties.model_validate(res.json())
+        return MassProperties.model_validate_json(res.content)
 
     def get_mass_property(
         self,
@@ -54,7 +54,7 @@ def transform_mesh(mesh: Mesh, transform: np.ndarray) -> Mesh:
     return mesh
 
 
-def transform_inertia_matrix(inertia_matrix: np.matrix, rotation: np.matrix) -> np.matrix:
+def transform_inertia_matrix(inertia_matrix: np.ndarray, rotation: np.ndarray) -> np.ndarray:
     """
     Transform an inertia matrix
 
@@ -47,14 +47,15 @@ Enum:
 """
 
 from enum import Enum
-from typing import Union
+from functools import cached_property
+from typing import Annotated, Any, Literal, Union
 
 import numpy as np
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 from onshape_robotics_toolkit.models.document import Document, DocumentMetaData
 from onshape_robotics_toolkit.models.mass import MassProperties
-from onshape_robotics_toolkit.utilities.helpers import generate_uid
+from onshape_robotics_toolkit.utilities.helpers import generate_uid_str
 
 
 class InstanceType(str, Enum):
@@ -176,7 +177,7 @@ class Occurrence(BaseModel):
         fixed (bool): Indicates if the occurrence is fixed in space.
         transform (list[float]): A 4x4 transformation matrix represented as a list of 16 floats.
         hidden (bool): Indicates if the occurrence is hidden.
-        path (list[str]): A list of strings representing the path to the instance.
+        path (tuple[str, ...]): A tuple of strings representing the path to the instance.
 
     Examples:
         >>> Occurrence(
@@ -198,10 +199,12 @@ class Occurrence(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     fixed: bool = Field(..., description="Indicates if the occurrence is fixed in space.")
     transform: list[float] = Field(..., description="A 4x4 transformation matrix represented as a list of 16 floats.")
     hidden: bool = Field(..., description="Indicates if the occurrence is hidden.")
-    path: list[str] = Field(..., description="A list of strings representing the path to the instance.")
+    path: tuple[str, ...] = Field(..., description="A tuple of strings representing the path to the instance.")
 
     @field_validator("transform")
     def check_transform(cls, v: list[float]) -> list[float]:
@@ -271,7 +274,7 @@ class IDBase(BaseModel):
 
         return v
 
-    @property
+    @cached_property
     def uid(self) -> str:
         """
         Generates a unique identifier for the part.
@@ -280,7 +283,7 @@ class IDBase(BaseModel):
             str: The unique identifier generated from documentId, documentMicroversion,
                 elementId, and fullConfiguration.
         """
-        return generate_uid([self.documentId, self.documentMicroversion, self.elementId, self.fullConfiguration])
+        return generate_uid_str(self.documentId, self.documentMicroversion, self.elementId, self.fullConfiguration)
 
 
 class PartMetadata(BaseModel):
@@ -377,8 +380,10 @@ class Part(IDBase):
     isStandardContent: bool = Field(..., description="Indicates if the part is standard content.")
     partId: str = Field(..., description="The unique identifier of the part.")
     bodyType: str = Field(..., description="The type of the body (e.g., solid, surface).")
-    mateConnectors: list[PartMateConnector] = Field(None, description="The mate connectors that belong to the part.")
-    documentVersion: str = Field(None, description="The version of the document.")
+    mateConnectors: Union[list[PartMateConnector], None] = Field(
+        None, description="The mate connectors that belong to the part."
+    )
+    documentVersion: Union[str, None] = Field(None, description="The version of the document.")
     MassProperty: Union[MassProperties, None] = Field(
         None, description="The mass properties of the part, this is a retrieved via a separate API call."
     )
@@ -393,7 +398,7 @@ class Part(IDBase):
         None, description="The workspace ID of the rigid assembly, if it is a sub-assembly."
     )
 
-    @property
+    @cached_property
     def uid(self) -> str:
         """
         Generates a unique identifier for the part.
@@ -402,13 +407,13 @@ class Part(IDBase):
             str: The unique identifier generated from documentId, documentMicroversion,
                 elementId, partId, and fullConfiguration.
         """
-        return generate_uid([
+        return generate_uid_str(
             self.documentId,
             self.documentMicroversion,
             self.elementId,
             self.partId,
             self.fullConfiguration,
-        ])
+        )
 
 
 class PartInstance(IDBase):
@@ -459,31 +464,17 @@ class PartInstance(IDBase):
         )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     isStandardContent: bool = Field(..., description="Indicates if the part is standard content.")
-    type: InstanceType = Field(..., description="The type of the instance, must be 'Part'.")
-    documentVersion: str = Field(None, description="The version of the document.")
+    type: Literal[InstanceType.PART] = Field(..., description="The type of the instance, must be 'Part'.")
+    documentVersion: Union[str, None] = Field(None, description="The version of the document.")
     id: str = Field(..., description="The unique identifier for the part instance.")
     name: str = Field(..., description="The name of the part instance.")
     suppressed: bool = Field(..., description="Indicates if the part instance is suppressed.")
     partId: str = Field(..., description="The identifier for the part.")
 
-    @field_validator("type")
-    def check_type(cls, v: InstanceType) -> InstanceType:
-        """
-        Validates that the type is 'Part'.
-
-        Args:
-            v (InstanceType): The type to validate.
-
-        Returns:
-            InstanceType: The validated type.
-        """
-        if v != InstanceType.PART:
-            raise ValueError("Type must be Part")
-
-        return v
-
-    @property
+    @cached_property
     def uid(self) -> str:
         """
         Generates a unique identifier for the part instance based on its attributes.
@@ -491,13 +482,13 @@ class PartInstance(IDBase):
         Returns:
             str: The unique identifier for the part instance.
         """
-        return generate_uid([
+        return generate_uid_str(
             self.documentId,
             self.documentMicroversion,
             self.elementId,
             self.partId,
             self.fullConfiguration,
-        ])
+        )
 
 
 class AssemblyInstance(IDBase):
@@ -541,7 +532,7 @@ class AssemblyInstance(IDBase):
     """
 
     id: str = Field(..., description="The unique identifier for the assembly instance.")
-    type: InstanceType = Field(..., description="The type of the instance, must be 'Assembly'.")
+    type: Literal[InstanceType.ASSEMBLY] = Field(..., description="The type of the instance, must be 'Assembly'.")
     name: str = Field(..., description="The name of the assembly instance.")
     suppressed: bool = Field(..., description="Indicates if the assembly instance is suppressed.")
 
@@ -551,22 +542,6 @@ class AssemblyInstance(IDBase):
         a sub-assembly with no degrees of freedom.",
     )
 
-    @field_validator("type")
-    def check_type(cls, v: InstanceType) -> InstanceType:
-        """
-        Validates that the type is 'Assembly'.
-
-        Args:
-            v (InstanceType): The type to validate.
-
-        Returns:
-            InstanceType: The validated type.
-        """
-        if v != InstanceType.ASSEMBLY:
-            raise ValueError("Type must be Assembly")
-
-        return v
-
 
 class MatedCS(BaseModel):
     """
@@ -603,15 +578,14 @@ class MatedCS(BaseModel):
         )
     """
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     xAxis: list[float] = Field(..., description="The x-axis vector of the coordinate system.")
     yAxis: list[float] = Field(..., description="The y-axis vector of the coordinate system.")
     zAxis: list[float] = Field(..., description="The z-axis vector of the coordinate system.")
     origin: list[float] = Field(..., description="The origin point of the coordinate system.")
 
-    part_tf: np.matrix = Field(
+    part_tf: Union[np.ndarray, None] = Field(
         None, description="The 4x4 transformation matrix from the part coordinate system to the mate coordinate system."
     )
 
@@ -635,12 +609,12 @@ class MatedCS(BaseModel):
         return v
 
     @property
-    def part_to_mate_tf(self) -> np.matrix:
+    def part_to_mate_tf(self) -> np.ndarray:
         """
         Generates a transformation matrix from the part coordinate system to the mate coordinate system.
 
         Returns:
-            np.matrix: The 4x4 transformation matrix.
+            np.ndarray: The 4x4 transformation matrix.
         """
         if self.part_tf is not None:
             return self.part_tf
@@ -650,27 +624,113 @@ class MatedCS(BaseModel):
         part_to_mate_tf = np.eye(4)
         part_to_mate_tf[:3, :3] = rotation_matrix
         part_to_mate_tf[:3, 3] = translation_vector
-        return np.matrix(part_to_mate_tf)
+        return part_to_mate_tf
 
     @classmethod
-    def from_tf(cls, tf: np.matrix) -> "MatedCS":
+    def from_tf(cls, tf: np.ndarray) -> "MatedCS":
         """
         Creates a MatedCS object from a 4x4 transformation matrix.
 
         Args:
-            tf (np.matrix): The 4x4 transformation matrix.
+            tf (np.ndarray): The 4x4 transformation matrix.
 
         Returns:
             MatedCS: The MatedCS object created from the transformation matrix.
         """
+        tf = np.asarray(tf, dtype=np.float64)
         return MatedCS(
-            xAxis=tf[:3, 0].flatten().tolist()[0],
-            yAxis=tf[:3, 1].flatten().tolist()[0],
-            zAxis=tf[:3, 2].flatten().tolist()[0],
-            origin=tf[:3, 3].flatten().tolist()[0],
+            xAxis=tf[:3, 0].tolist(),
+            yAxis=tf[:3, 1].tolist(),
+            zAxis=tf[:3, 2].tolist(),
+            origin=tf[:3, 3].tolist(),
             part_tf=tf,
         )
 
+    @classmethod
+    def from_tf_batch(cls, tfs: np.ndarray) -> list["MatedCS"]:
+        """
+        Creates MatedCS objects from a stack of 4x4 transformation matrices.
+
+        The axes and origins of all transforms are extracted with a single slice of the stacked array instead of four
+        slices per transform.
+
+        Args:
+            tfs (np.ndarray): The transformation matrices, as a (K, 4, 4) array or a (K, 16) array of row-major values.
+
+        Returns:
+            list[MatedCS]: The MatedCS objects created from the transformation matrices.
+
+        Examples:
+            >>> MatedCS.from_tf_batch([occurrence.transform for occurrence in root_assembly.occurrences])
+            [MatedCS(...), MatedCS(...)]
+        """
+        tfs = np.asarray(tfs, dtype=np.float64).reshape(-1, 4, 4)
+        # (K, 3, 4) -> (K, 4, 3): one row per column of the transform, i.e. x-axis, y-axis, z-axis and origin
+        columns = tfs[:, :3, :].transpose(0, 2, 1).tolist()
+        return [
+            cls(xAxis=x_axis, yAxis=y_axis, zAxis=z_axis, origin=origin, part_tf=tf)
+            for (x_axis, y_axis, z_axis, origin), tf in zip(columns, tfs)
+        ]
+
+    @staticmethod
+    def to_tf_batch(mated_cs: list["MatedCS"]) -> np.ndarray:
+        """
+        Stacks the part to mate transformation matrices of several MatedCS objects into a single array.
+
+        The axes and origins of all coordinate systems are packed into one (K, 4, 3) array and written into the stack
+        with a single transpose, so downstream frame math can operate on the whole batch with `np.matmul` instead of
+        building one matrix per coordinate system.
+
+        Args:
+            mated_cs (list[MatedCS]): The MatedCS objects to stack.
+
+        Returns:
+            np.ndarray: The (K, 4, 4) stack of part to mate transformation matrices.
+
+        Examples:
+            >>> mate_tfs = MatedCS.to_tf_batch([entity.matedCS for entity in mate.matedEntities])
+            >>> mate_tfs.shape
+            (2, 4, 4)
+        """
+        tfs = np.zeros((len(mated_cs), 4, 4))
+        tfs[:, 3, 3] = 1.0
+        if len(mated_cs) == 0:
+            return tfs
+
+        # (K, 4, 3) -> (K, 3, 4): x-axis, y-axis, z-axis and origin become the columns of each transform
+        columns = np.array([[cs.xAxis, cs.yAxis, cs.zAxis, cs.origin] for cs in mated_cs], dtype=np.float64)
+        tfs[:, :3, :] = columns.transpose(0, 2, 1)
+        return tfs
+
+    @staticmethod
+    def compose_chain(tfs: list[np.ndarray]) -> np.ndarray:
+        """
+        Composes a chain of 4x4 transformation matrices into a single transformation matrix.
+
+        The chain is multiplied in a single `np.linalg.multi_dot` call instead of one `@` per transform, which
+        amortizes the per-operation dispatch when walking long kinematic chains.
+
+        Args:
+            tfs (list[np.ndarray]): The 4x4 transformation matrices, ordered from the base to the tip of the chain.
+
+        Returns:
+            np.ndarray: The 4x4 transformation matrix of the composed chain.
+
+        Examples:
+            >>> MatedCS.compose_chain([parent_cs.part_tf, mated_cs.part_to_mate_tf])
+            array([[1., 0., 0., 0.],
+                   [0., 1., 0., 0.],
+                   [0., 0., 1., 0.],
+                   [0., 0., 0., 1.]])
+        """
+        if len(tfs) == 0:
+            return np.eye(4)
+
+        if len(tfs) == 1:
+            return np.array(tfs[0], dtype=float)
+
+        return np.linalg.multi_dot([np.asarray(tf, dtype=float) for tf in tfs])
+
 
 class MatedEntity(BaseModel):
     """
@@ -690,7 +750,7 @@ class MatedEntity(BaseModel):
         ```
 
     Attributes:
-        matedOccurrence (list[str]): A list of identifiers for the occurrences that are mated.
+        matedOccurrence (tuple[str, ...]): A tuple of identifiers for the occurrences that are mated.
         matedCS (MatedCS): The coordinate system used for mating the parts.
 
     Examples:
@@ -714,10 +774,12 @@ class MatedEntity(BaseModel):
         )
     """
 
-    matedOccurrence: list[str] = Field(..., description="A list of identifiers for the occurrences that are mated.")
+    matedOccurrence: tuple[str, ...] = Field(
+        ..., description="A tuple of identifiers for the occurrences that are mated."
+    )
     matedCS: MatedCS = Field(..., description="The coordinate system used for mating the parts.")
 
-    parentCS: MatedCS = Field(
+    parentCS: Union[MatedCS, None] = Field(
         None, description="The 4x4 transformation matrix for the mate feature, used for custom transformations."
     )
 
@@ -749,6 +811,8 @@ class MateRelationMate(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     featureId: str = Field(..., description="The unique identifier of the mate feature.")
     occurrence: list[str] = Field(
         ..., description="A list of identifiers for the occurrences involved in the mate relation."
@@ -767,7 +831,7 @@ class MateGroupFeatureOccurrence(BaseModel):
         ```
 
     Attributes:
-        occurrence (list[str]): A list of identifiers for the occurrences in the mate group feature.
+        occurrence (tuple[str, ...]): A tuple of identifiers for the occurrences in the mate group feature.
 
     Examples:
         >>> MateGroupFeatureOccurrence(
@@ -778,8 +842,10 @@ class MateGroupFeatureOccurrence(BaseModel):
         )
     """
 
-    occurrence: list[str] = Field(
-        ..., description="A list of identifiers for the occurrences in the mate group feature."
+    model_config = ConfigDict(frozen=True)
+
+    occurrence: tuple[str, ...] = Field(
+        ..., description="A tuple of identifiers for the occurrences in the mate group feature."
     )
 
 
@@ -805,6 +871,7 @@ class MateGroupFeatureData(BaseModel):
 
     Custom Attributes:
         id (str): The unique identifier of the feature.
+        featureType (AssemblyFeatureType): The type of the feature, copied from the parent assembly feature.
 
     Examples:
         >>> MateGroupFeatureData(
@@ -825,12 +892,17 @@ class MateGroupFeatureData(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
     occurrences: list[MateGroupFeatureOccurrence] = Field(
         ..., description="A list of occurrences in the mate group feature."
     )
     name: str = Field(..., description="The name of the mate group feature.")
 
-    id: str = Field(None, description="The unique identifier of the feature.")
+    id: Union[str, None] = Field(None, description="The unique identifier of the feature.")
+    featureType: Literal[AssemblyFeatureType.MATEGROUP] = Field(
+        AssemblyFeatureType.MATEGROUP, description="The type of the feature, used to discriminate the feature data."
+    )
 
 
 class MateConnectorFeatureData(BaseModel):
@@ -860,6 +932,7 @@ class MateConnectorFeatureData(BaseModel):
 
     Custom Attributes:
         id (str): The unique identifier of the feature.
+        featureType (AssemblyFeatureType): The type of the feature, copied from the parent assembly feature.
 
     Examples:
         >>> MateConnectorFeatureData(
@@ -884,13 +957,18 @@ class MateConnectorFeatureData(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
     mateConnectorCS: MatedCS = Field(..., description="The coordinate system used for the mate connector.")
     occurrence: list[str] = Field(
         ..., description="A list of identifiers for the occurrences involved in the mate connector."
     )
     name: str = Field(..., description="The name of the mate connector feature.")
 
-    id: str = Field(None, description="The unique identifier of the feature.")
+    id: Union[str, None] = Field(None, description="The unique identifier of the feature.")
+    featureType: Literal[AssemblyFeatureType.MATECONNECTOR] = Field(
+        AssemblyFeatureType.MATECONNECTOR, description="The type of the feature, used to discriminate the feature data."
+    )
 
 
 class MateRelationFeatureData(BaseModel):
@@ -921,12 +999,17 @@ class MateRelationFeatureData(BaseModel):
         relationType (RelationType): The type of mate relation.
         mates (list[MateRelationMate]): A list of mate relations.
         reverseDirection (bool): Indicates if the direction of the mate relation is reversed.
-        relationRatio (Union[float, None]): The ratio of the GEAR mate relation. Defaults to None.
-        relationLength (Union[float, None]): The length of the RACK_AND_PINION mate relation. Defaults to None.
+        relationRatio (float): The ratio of the GEAR mate relation. Defaults to NaN.
+        relationLength (float): The length of the RACK_AND_PINION mate relation. Defaults to NaN.
         name (str): The name of the mate relation feature.
 
     Custom Attributes:
         id (str): The unique identifier of the feature.
+        featureType (AssemblyFeatureType): The type of the feature, copied from the parent assembly feature.
+
+    Properties:
+        has_ratio (bool): Indicates if the relation carries a ratio.
+        has_length (bool): Indicates if the relation carries a length.
 
     Examples:
         >>> MateRelationFeatureData(
@@ -945,18 +1028,49 @@ class MateRelationFeatureData(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
     relationType: RelationType = Field(..., description="The type of mate relation.")
     mates: list[MateRelationMate] = Field(..., description="A list of mate relations.")
     reverseDirection: bool = Field(..., description="Indicates if the direction of the mate relation is reversed.")
-    relationRatio: Union[float, None] = Field(
-        None, description="The ratio of the GEAR mate relation. Defaults to None."
-    )
-    relationLength: Union[float, None] = Field(
-        None, description="The length of the RACK_AND_PINION mate relation. Defaults to None."
+    # Missing values are stored as NaN rather than None so that ratios and lengths pack into float arrays
+    relationRatio: float = Field(float("nan"), description="The ratio of the GEAR mate relation. Defaults to NaN.")
+    relationLength: float = Field(
+        float("nan"), description="The length of the RACK_AND_PINION mate relation. Defaults to NaN."
     )
     name: str = Field(..., description="The name of the mate relation feature.")
 
-    id: str = Field(None, description="The unique identifier of the feature.")
+    id: Union[str, None] = Field(None, description="The unique identifier of the feature.")
+    featureType: Literal[AssemblyFeatureType.MATERELATION] = Field(
+        AssemblyFeatureType.MATERELATION, description="The type of the feature, used to discriminate the feature data."
+    )
+
+    @field_validator("relationRatio", "relationLength", mode="before")
+    def coerce_missing_to_nan(cls, v):
+        """
+        Maps a missing ratio or length to NaN.
+        """
+        return float("nan") if v is None else v
+
+    @property
+    def has_ratio(self) -> bool:
+        """
+        Indicates if the relation carries a ratio.
+
+        Returns:
+            bool: True if `relationRatio` is set.
+        """
+        return not np.isnan(self.relationRatio)
+
+    @property
+    def has_length(self) -> bool:
+        """
+        Indicates if the relation carries a length.
+
+        Returns:
+            bool: True if `relationLength` is set.
+        """
+        return not np.isnan(self.relationLength)
 
 
 class MateFeatureData(BaseModel):
@@ -1000,6 +1114,7 @@ class MateFeatureData(BaseModel):
 
     Custom Attributes:
         id (str): The unique identifier of the feature.
+        featureType (AssemblyFeatureType): The type of the feature, copied from the parent assembly feature.
 
     Examples:
         >>> MateFeatureData(
@@ -1015,14 +1130,16 @@ class MateFeatureData(BaseModel):
 
     """
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True)
 
     matedEntities: list[MatedEntity] = Field(..., description="A list of mated entities.")
     mateType: MateType = Field(..., description="The type of mate.")
     name: str = Field(..., description="The name of the mate feature.")
 
-    id: str = Field(None, description="The unique identifier of the feature.")
+    id: Union[str, None] = Field(None, description="The unique identifier of the feature.")
+    featureType: Literal[AssemblyFeatureType.MATE] = Field(
+        AssemblyFeatureType.MATE, description="The type of the feature, used to discriminate the feature data."
+    )
 
 
 class AssemblyFeature(BaseModel):
@@ -1094,12 +1211,45 @@ class AssemblyFeature(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
     id: str = Field(..., description="The unique identifier of the feature.")
     suppressed: bool = Field(..., description="Indicates if the feature is suppressed.")
     featureType: AssemblyFeatureType = Field(..., description="The type of the feature.")
-    featureData: Union[MateGroupFeatureData, MateConnectorFeatureData, MateRelationFeatureData, MateFeatureData] = (
-        Field(..., description="Data associated with the assembly feature.")
-    )
+    featureData: Annotated[
+        Union[MateGroupFeatureData, MateConnectorFeatureData, MateRelationFeatureData, MateFeatureData],
+        Field(discriminator="featureType"),
+    ] = Field(..., description="Data associated with the assembly feature.")
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_feature_data_tags(cls, data: Any) -> Any:
+        """
+        Copies the feature id and type into the raw feature data. The id lets the feature data be looked up on its
+        own, and the type is the discriminator that selects the feature data model without trying each one in turn.
+        Feature data given as a model instance is frozen, so it is copied with the id set instead.
+
+        Args:
+            data (Any): The raw assembly feature data.
+
+        Returns:
+            Any: The assembly feature data with the id and type set on the nested feature data.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        feature_data = data.get("featureData")
+        if isinstance(feature_data, dict):
+            feature_data = dict(feature_data)
+            if "id" in data:
+                feature_data["id"] = data["id"]
+            if "featureType" in data:
+                feature_data["featureType"] = data["featureType"]
+            data = {**data, "featureData": feature_data}
+        elif isinstance(feature_data, BaseModel) and "id" in data and feature_data.id != data["id"]:
+            data = {**data, "featureData": feature_data.model_copy(update={"id": data["id"]})}
+
+        return data
 
 
 class Pattern(BaseModel):
@@ -1143,6 +1293,8 @@ class SubAssembly(IDBase):
     Properties:
         uid (str): A unique identifier for the sub-assembly based on documentId, documentMicroversion, elementId, and
             fullConfiguration.
+        part_instances (list[PartInstance]): The part instances in the sub-assembly.
+        assembly_instances (list[AssemblyInstance]): The assembly instances in the sub-assembly.
 
     Examples:
         >>> SubAssembly(
@@ -1168,17 +1320,22 @@ class SubAssembly(IDBase):
 
     """
 
-    instances: list[Union[PartInstance, AssemblyInstance]] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    instances: list[Annotated[Union[PartInstance, AssemblyInstance], Field(discriminator="type")]] = Field(
         ..., description="A list of part and assembly instances in the sub-assembly."
     )
     patterns: list[Pattern] = Field(..., description="A list of patterns in the sub-assembly.")
     features: list[AssemblyFeature] = Field(..., description="A list of features in the sub-assembly")
 
+    # Populated by a separate API call, so it is left out of serialized assemblies
     MassProperty: Union[MassProperties, None] = Field(
-        None, description="The mass properties of the sub-assembly, this is a retrieved via a separate API call."
+        default=None,
+        exclude=True,
+        description="The mass properties of the sub-assembly, this is a retrieved via a separate API call.",
     )
 
-    @property
+    @cached_property
     def uid(self) -> str:
         """
         Generates a unique identifier for the sub-assembly with documentId, documentMicroversion, elementId, and
@@ -1187,7 +1344,27 @@ class SubAssembly(IDBase):
         Returns:
             str: The unique identifier for the sub-assembly.
         """
-        return generate_uid([self.documentId, self.documentMicroversion, self.elementId, self.fullConfiguration])
+        return generate_uid_str(self.documentId, self.documentMicroversion, self.elementId, self.fullConfiguration)
+
+    @property
+    def part_instances(self) -> list[PartInstance]:
+        """
+        Part instances of the sub-assembly, filtered from `instances`.
+
+        Returns:
+            list[PartInstance]: The part instances in the order they appear in `instances`.
+        """
+        return [instance for instance in self.instances if instance.type == InstanceType.PART]
+
+    @property
+    def assembly_instances(self) -> list[AssemblyInstance]:
+        """
+        Assembly instances of the sub-assembly, filtered from `instances`.
+
+        Returns:
+            list[AssemblyInstance]: The assembly instances in the order they appear in `instances`.
+        """
+        return [instance for instance in self.instances if instance.type == InstanceType.ASSEMBLY]
 
 
 class RootAssembly(SubAssembly):
@@ -1246,10 +1423,13 @@ class RootAssembly(SubAssembly):
         )
     """
 
+    # Mass properties and document metadata are attached to the root assembly after the response is parsed
+    model_config = ConfigDict(frozen=False)
+
     occurrences: list[Occurrence] = Field(..., description="A list of occurrences in the root assembly.")
 
     documentMetaData: Union[DocumentMetaData, None] = Field(
-        None, description="The document associated with the assembly."
+        default=None, exclude=True, description="The document associated with the assembly."
     )
 
 
@@ -1331,6 +1511,81 @@ class Assembly(BaseModel):
     document: Union[Document, None] = Field(None, description="The document associated with the assembly.")
     name: Union[str, None] = Field(None, description="The name of the assembly.")
 
+    _occurrence_by_path: dict[tuple[str, ...], Occurrence] = PrivateAttr(default_factory=dict)
+    _mate_by_feature_id: dict[str, MateFeatureData] = PrivateAttr(default_factory=dict)
+    _relation_ratios: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0))
+
+    def model_post_init(self, __context: Any) -> None:
+        self.build_index()
+
+    def build_index(self) -> None:
+        """
+        Build the occurrence and mate lookup tables in a single walk over the assembly.
+
+        Occurrences are indexed by their instance path and mate features by their feature id, so that consumers can
+        resolve mates against occurrences without re-scanning the root and sub-assembly lists. The ratios of the mate
+        relations are collected into a single array along the way.
+
+        Examples:
+            >>> assembly.build_index()
+            >>> assembly.occurrence_by_path[("M0Cyvy+yIq8Rd7En0",)]
+            Occurrence(...)
+        """
+        occurrence_by_path: dict[tuple[str, ...], Occurrence] = {}
+        mate_by_feature_id: dict[str, MateFeatureData] = {}
+        relation_ratios: list[float] = []
+
+        for occurrence in self.rootAssembly.occurrences:
+            occurrence_by_path[occurrence.path] = occurrence
+
+        for assembly in (self.rootAssembly, *self.subAssemblies):
+            for feature in assembly.features:
+                if feature.featureType == AssemblyFeatureType.MATE:
+                    mate_by_feature_id[feature.id] = feature.featureData
+                elif feature.featureType == AssemblyFeatureType.MATERELATION:
+                    relation_ratios.append(feature.featureData.relationRatio)
+
+        self._occurrence_by_path = occurrence_by_path
+        self._mate_by_feature_id = mate_by_feature_id
+        self._relation_ratios = np.array(relation_ratios, dtype=np.float64)
+
+    @property
+    def occurrence_by_path(self) -> dict[tuple[str, ...], Occurrence]:
+        """
+        Occurrences of the root assembly indexed by their instance path.
+
+        Returns:
+            dict[tuple[str, ...], Occurrence]: A dictionary mapping occurrence paths to occurrences.
+        """
+        return self._occurrence_by_path
+
+    @property
+    def mate_by_feature_id(self) -> dict[str, MateFeatureData]:
+        """
+        Mate features of the root and sub-assemblies indexed by their feature id.
+
+        Returns:
+            dict[str, MateFeatureData]: A dictionary mapping feature ids to mate feature data.
+        """
+        return self._mate_by_feature_id
+
+    def relation_ratios(self) -> np.ndarray:
+        """
+        Ratios of the mate relations of the root and sub-assemblies, in feature order.
+
+        Relations without a ratio are NaN, so batch consumers can mask them with `~np.isnan(ratios)` instead of
+        checking each relation in Python.
+
+        Returns:
+            np.ndarray: A 1D float array with one ratio per mate relation.
+
+        Examples:
+            >>> ratios = assembly.relation_ratios()
+            >>> ratios[~np.isnan(ratios)]
+            array([1.])
+        """
+        return self._relation_ratios
+
 
 if __name__ == "__main__":
     # mated_cs = MatedCS(
@@ -1342,5 +1597,5 @@ if __name__ == "__main__":
 
     transform = [1.0, 0.0, 0.0, 0.1, 0.0, 1.0, 0.0, -0.15, 0.0, 0.0, 1.0, -0.01, 0.0, 0.0, 0.0, 1.0]
 
-    mated_cs = MatedCS.from_tf(np.matrix(transform).reshape(4, 4))
+    mated_cs = MatedCS.from_tf(np.asarray(transform, dtype=np.float64).reshape(4, 4))
     print(mated_cs.xAxis, mated_cs.yAxis, mated_cs.zAxis, mated_cs.origin)
@@ -27,13 +27,17 @@ Enum:
       version, microversion).
 """
 
+import re
+import sys
 from enum import Enum
-from typing import Union, cast
+from typing import Annotated, Literal, Union
 
-import regex as re
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
 
-BASE_URL = "https://cad.onshape.com"
+BASE_URL = sys.intern("https://cad.onshape.com")
+
+# Onshape document, workspace, and element IDs are always 24 characters long
+OnshapeId = Annotated[str, StringConstraints(min_length=24, max_length=24)]
 
 __all__ = ["WorkspaceType", "Document", "parse_url"]
 
@@ -89,6 +93,10 @@ class MetaWorkspaceType(str, Enum):
 
 # Pattern for matching Onshape document URLs
 DOCUMENT_PATTERN = r"(https://[\w\d\.]+)/documents/([\w\d]+)/(w|v|m)/([\w\d]+)/e/([\w\d]+)"
+_DOCUMENT_RE = re.compile(DOCUMENT_PATTERN)
+
+# Template for Onshape document element URLs, filled by `generate_url`
+_URL_FMT = "%s/documents/%s/%s/%s/e/%s"
 
 
 def generate_url(base_url: str, did: str, wtype: str, wid: str, eid: str) -> str:
@@ -96,6 +104,7 @@ def generate_url(base_url: str, did: str, wtype: str, wid: str, eid: str) -> str
     Generate Onshape URL from document ID, workspace type, workspace ID, and element ID
 
     Args:
+        base_url: The base URL of the Onshape instance
         did: The unique identifier of the document
         wtype: The type of workspace (w, v, m)
         wid: The unique identifier of the workspace
@@ -105,20 +114,27 @@ def generate_url(base_url: str, did: str, wtype: str, wid: str, eid: str) -> str
         url: URL to the Onshape document element
 
     Examples:
-        >>> generate_url("a1c1addf75444f54b504f25c", "w", "0d17b8ebb2a4c76be9fff3c7", "a86aaf34d2f4353288df8812")
+        >>> generate_url(
+        ...     "https://cad.onshape.com",
+        ...     "a1c1addf75444f54b504f25c",
+        ...     "w",
+        ...     "0d17b8ebb2a4c76be9fff3c7",
+        ...     "a86aaf34d2f4353288df8812",
+        ... )
         "https://cad.onshape.com/documents/a1c1addf75444f54b504f25c/w/0d17b8ebb2a4c76be9fff3c7/e/a86aaf34d2f4353288df8812"
     """
-    return f"{base_url}/documents/{did}/{wtype}/{wid}/e/{eid}"
+    return _URL_FMT % (base_url, did, wtype, wid, eid)
 
 
-def parse_url(url: str) -> str:
+def parse_url(url: str) -> tuple[str, str, str, str, str]:
     """
-    Parse Onshape URL and return document ID, workspace type, workspace ID, and element ID
+    Parse Onshape URL and return base URL, document ID, workspace type, workspace ID, and element ID
 
     Args:
         url: URL to an Onshape document element
 
     Returns:
+        base_url: The base URL of the Onshape instance
         did: The unique identifier of the document
         wtype: The type of workspace (w, v, m)
         wid: The unique identifier of the workspace
@@ -129,23 +145,17 @@ def parse_url(url: str) -> str:
 
     Examples:
         >>> parse_url("https://cad.onshape.com/documents/a1c1addf75444f54b504f25c/w/0d17b8ebb2a4c76be9fff3c7/e/a86aaf34d2f4353288df8812")
-        ("a1c1addf75444f54b504f25c", "w", "0d17b8ebb2a4c76be9fff3c7", "a86aaf34d2f4353288df8812")
+        ("https://cad.onshape.com", "a1c1addf75444f54b504f25c", "w", "0d17b8ebb2a4c76be9fff3c7",
+         "a86aaf34d2f4353288df8812")
     """
-    pattern = re.match(
-        DOCUMENT_PATTERN,
-        url,
-    )
+    pattern = _DOCUMENT_RE.match(url)
 
     if not pattern:
         raise ValueError("Invalid Onshape URL")
 
-    base_url = pattern.group(1)
-    did = pattern.group(2)
-    wtype = cast(WorkspaceType, pattern.group(3))
-    wid = pattern.group(4)
-    eid = pattern.group(5)
+    base_url, did, wtype, wid, eid = pattern.groups()
 
-    return base_url, did, wtype, wid, eid
+    return sys.intern(base_url), did, sys.intern(wtype), wid, eid
 
 
 class Document(BaseModel):
@@ -182,60 +192,23 @@ class Document(BaseModel):
 
     url: Union[str, None] = Field(None, description="URL to the document element")
     base_url: str = Field(BASE_URL, description="Base URL of the document")
-    did: str = Field(..., description="The unique identifier of the document")
-    wtype: str = Field(..., description="The type of workspace (w, v, m)")
-    wid: str = Field(..., description="The unique identifier of the workspace")
-    eid: str = Field(..., description="The unique identifier of the element")
-    name: str = Field(None, description="The name of the document")
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        if self.url is None:
-            self.url = generate_url(self.base_url, self.did, self.wtype, self.wid, self.eid)
-
-    @field_validator("did", "wid", "eid")
-    def check_ids(cls, value: str) -> str:
-        """
-        Validate the document, workspace, and element IDs
-
-        Args:
-            value: The ID to validate
-
-        Returns:
-            value: The validated ID
-
-        Raises:
-            ValueError: If the ID is empty or not 24 characters long
-        """
-        if not value:
-            raise ValueError("ID cannot be empty, please check the URL")
-        if not len(value) == 24:
-            raise ValueError("ID must be 24 characters long, please check the URL")
-        return value
-
-    @field_validator("wtype")
-    def check_wtype(cls, value: str) -> str:
+    did: OnshapeId = Field(..., description="The unique identifier of the document")
+    wtype: Literal["w", "v", "m"] = Field(..., description="The type of workspace (w, v, m)")
+    wid: OnshapeId = Field(..., description="The unique identifier of the workspace")
+    eid: OnshapeId = Field(..., description="The unique identifier of the element")
+    name: Union[str, None] = Field(None, description="The name of the document")
+
+    @model_validator(mode="after")
+    def fill_url(self) -> "Document":
         """
-        Validate the workspace type
-
-        Args:
-            value: The workspace type to validate
+        Generate the document URL from its IDs if one was not provided
 
         Returns:
-            value: The validated workspace type
-
-        Raises:
-            ValueError: If the workspace type is empty or not one of the valid values
+            Document: The validated Document instance
         """
-        if not value:
-            raise ValueError("Workspace type cannot be empty, please check the URL")
-
-        if value not in WorkspaceType.__members__.values():
-            raise ValueError(
-                f"Invalid workspace type. Must be one of {WorkspaceType.__members__.values()}, please check the URL"
-            )
-
-        return value
+        if self.url is None:
+            self.url = generate_url(self.base_url, self.did, self.wtype, self.wid, self.eid)
+        return self
 
     @classmethod
     def from_url(cls, url: str) -> "Document":
@@ -289,6 +262,8 @@ class DefaultWorkspace(BaseModel):
         DefaultWorkspace(id="739221fb10c88c2bebb456e8", type="workspace")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="The unique identifier of the workspace")
     type: MetaWorkspaceType = Field(..., description="The type of workspace (workspace, version, microversion)")
 
@@ -12,16 +12,26 @@ and safer manipulation of the data within the application.
 
 Models:
     - **Element**: Represents an Onshape element, containing the element ID, name, type, and microversion ID.
+    - **ElementNT**: Lightweight tuple twin of Element for in-memory transforms of already validated elements.
 
 Enum:
     - **ElementType**: Enumerates the possible element types in Onshape (PARTSTUDIO, ASSEMBLY, DRAWING, etc.).
+
+Constants:
+    - **ELEMENT_LIST_ADAPTER**: Shared validator for lists of Elements, e.g. the elements endpoint response.
+
+Functions:
+    - **decode_elements**: Decode a raw Onshape elements response into a list of Elements.
 """
 
 from enum import Enum
+from typing import NamedTuple, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter
 
-__all__ = ["Element", "ElementType"]
+from onshape_robotics_toolkit.models.document import OnshapeId
+
+__all__ = ["ELEMENT_LIST_ADAPTER", "Element", "ElementNT", "ElementType", "decode_elements"]
 
 
 class ElementType(str, Enum):
@@ -55,6 +65,30 @@ class ElementType(str, Enum):
     FEATURESTUDIO = "FEATURESTUDIO"
 
 
+class ElementNT(NamedTuple):
+    """
+    Lightweight, immutable twin of `Element` for already validated elements.
+
+    Building a tuple is much cheaper than building a Pydantic model, so in-memory transforms (filtering, grouping,
+    copying) should work on `ElementNT` and only convert back to `Element` at API boundaries.
+
+    Attributes:
+        id (str): The unique identifier of the element.
+        name (str): The name of the element.
+        elementType (ElementType): The type of the element (e.g., PARTSTUDIO, ASSEMBLY, DRAWING).
+        microversionId (str): The unique identifier of the microversion of the element.
+
+    Examples:
+        >>> nt = element.to_nt()
+        >>> [e for e in elements_nt if e.elementType == ElementType.ASSEMBLY]
+    """
+
+    id: str
+    name: str
+    elementType: ElementType
+    microversionId: str
+
+
 class Element(BaseModel):
     """
     Represents an Onshape element, containing the element ID, name, type, and microversion ID.
@@ -86,78 +120,104 @@ class Element(BaseModel):
     Attributes:
         id (str): The unique identifier of the element.
         name (str): The name of the element.
-        elementType (str): The type of the element (e.g., PARTSTUDIO, ASSEMBLY, DRAWING).
+        elementType (ElementType): The type of the element (e.g., PARTSTUDIO, ASSEMBLY, DRAWING).
         microversionId (str): The unique identifier of the microversion of the element.
 
+    Methods:
+        from_trusted: Create an Element from already validated data without re-validating it.
+        to_nt: Convert the Element to its lightweight `ElementNT` twin.
+        from_nt: Create an Element from an `ElementNT` without re-validating it.
+
     Examples:
         >>> element = Element(id="0b0c209535554345432581fe", name="wheelAndFork", elementType="PARTSTUDIO",
         ...                   microversionId="9b3be6165c7a2b1f6dd61305")
         >>> element
-        Element(id='0b0c209535554345432581fe', name='wheelAndFork', elementType='PARTSTUDIO',
+        Element(id='0b0c209535554345432581fe', name='wheelAndFork', elementType=<ElementType.PARTSTUDIO: 'PARTSTUDIO'>,
                 microversionId='9b3be6165c7a2b1f6dd61305')
+        >>> element.elementType is ElementType.PARTSTUDIO
+        True
     """
 
-    id: str = Field(..., description="The unique identifier of the element")
+    id: OnshapeId = Field(..., description="The unique identifier of the element")
     name: str = Field(..., description="The name of the element")
-    elementType: str = Field(..., description="The type of the element")
-    microversionId: str = Field(..., description="The unique identifier of the microversion of the element")
+    elementType: ElementType = Field(..., description="The type of the element")
+    microversionId: OnshapeId = Field(..., description="The unique identifier of the microversion of the element")
 
-    @field_validator("elementType")
-    def validate_type(cls, value: str) -> str:
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Element":
         """
-        Validate the element type.
+        Create an Element from data that has already been validated, e.g. an element previously dumped with
+        `model_dump`, without running validation again.
+
+        This must never be used on raw API responses: fields are stored as given, so `elementType` is only an
+        `ElementType` member if the data already holds one.
 
         Args:
-            value: The element type to validate.
+            data: The already validated element data.
 
         Returns:
-            The validated element type.
+            The Element built from the data.
+
+        Examples:
+            >>> cached = element.model_dump()
+            >>> Element.from_trusted(cached) == element
+            True
+        """
+        return cls.model_construct(**data)
 
-        Raises:
-            ValueError: If the element type is not one of the valid types.
+    def to_nt(self) -> ElementNT:
         """
+        Convert the Element to its lightweight `ElementNT` twin.
 
-        if value not in ElementType.__members__.values():
-            raise ValueError(f"Invalid element type: {value}")
+        Returns:
+            The ElementNT holding the same field values.
 
-        return value
+        Examples:
+            >>> element.to_nt()
+            ElementNT(id='0b0c209535554345432581fe', name='wheelAndFork', elementType=<ElementType.PARTSTUDIO: ...>,
+                      microversionId='9b3be6165c7a2b1f6dd61305')
+        """
+        return ElementNT(self.id, self.name, self.elementType, self.microversionId)
 
-    @field_validator("id")
-    def validate_id(cls, value: str) -> str:
+    @classmethod
+    def from_nt(cls, nt: ElementNT) -> "Element":
         """
-        Validate the element ID.
+        Create an Element from an `ElementNT` without running validation again.
 
         Args:
-            value: The element ID to validate.
+            nt: The ElementNT, typically produced by `to_nt`.
 
         Returns:
-            The validated element ID.
+            The Element built from the tuple.
 
-        Raises:
-            ValueError: If the element ID is not 24 characters long.
+        Examples:
+            >>> Element.from_nt(element.to_nt()) == element
+            True
         """
+        return cls.model_construct(**nt._asdict())
 
-        if len(value) != 24:
-            raise ValueError(f"Invalid element ID: {value}, must be 24 characters long")
 
-        return value
+# Validator for element list responses, built once at import so callers never rebuild the schema per request
+ELEMENT_LIST_ADAPTER = TypeAdapter(list[Element])
 
-    @field_validator("microversionId")
-    def validate_mid(cls, value: str) -> str:
-        """
-        Validate the microversion ID.
 
-        Args:
-            value: The microversion ID to validate.
+def decode_elements(raw: Union[str, bytes]) -> list[Element]:
+    """
+    Decode a raw Onshape elements response into a list of Elements.
 
-        Returns:
-            The validated microversion ID.
+    The JSON is parsed directly by the Pydantic validator, without building an intermediate Python list of
+    dictionaries first.
 
-        Raises:
-            ValueError: If the microversion ID is not 24 characters long.
-        """
+    Args:
+        raw: The raw JSON response body.
 
-        if len(value) != 24:
-            raise ValueError(f"Invalid microversion ID: {value}, must be 24 characters long")
+    Returns:
+        The decoded elements.
 
-        return value
+    Raises:
+        ValidationError: If the response does not match the Element schema.
+
+    Examples:
+        >>> elements = decode_elements(response.content)
+    """
+    return ELEMENT_LIST_ADAPTER.validate_json(raw)
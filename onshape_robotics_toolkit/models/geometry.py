@@ -2,24 +2,49 @@
 This module contains classes for representing geometry in Onshape.
 
 Class:
-    - **BaseGeometry**: Abstract base class for geometry objects.
+    - **BaseGeometry**: Protocol implemented by all geometry objects.
     - **BoxGeometry**: Represents a box geometry.
     - **CylinderGeometry**: Represents a cylinder geometry.
     - **SphereGeometry**: Represents a sphere geometry.
     - **MeshGeometry**: Represents a mesh geometry.
+
+Functions:
+    - **emit_batch**: Append the URDF elements of several geometries to a root element in one call.
+    - **make_box**: Get a shared box geometry for the given size.
+    - **make_cylinder**: Get a shared cylinder geometry for the given radius and length.
+    - **make_sphere**: Get a shared sphere geometry for the given radius.
+    - **make_mesh**: Get a shared mesh geometry for the given filename.
 """
 
 import os
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import BinaryIO, Optional, Protocol
+from xml.sax.saxutils import escape
 
 import lxml.etree as ET
+import numpy as np
 
 from onshape_robotics_toolkit.utilities import format_number, xml_escape
 
 
+def _fmt3(a: float, b: float, c: float) -> str:
+    """
+    Format three numbers as a space-separated string, e.g. the size of a box.
+    """
+    return f"{format_number(a)} {format_number(b)} {format_number(c)}"
+
+
+def _fmt2(a: float, b: float) -> str:
+    """
+    Format two numbers as a space-separated string, e.g. the size of a cylinder.
+    """
+    return f"{format_number(a)} {format_number(b)}"
+
+
 class GeometryType(str, Enum):
     """
     Enumerates the possible geometry types in Onshape.
@@ -43,32 +68,49 @@ class GeometryType(str, Enum):
     MESH = "mesh"
 
 
-@dataclass
-class BaseGeometry(ABC):
+# Plain string values of the geometry types, passed to lxml instead of the enum members
+_TYPE_BOX = GeometryType.BOX.value
+_TYPE_CYLINDER = GeometryType.CYLINDER.value
+_TYPE_SPHERE = GeometryType.SPHERE.value
+_TYPE_MESH = GeometryType.MESH.value
+
+# Below this many elements, parsing each size string in Python is cheaper than a round trip through NumPy
+_FROM_XML_BATCH_THRESHOLD = 64
+
+
+class BaseGeometry(Protocol):
     """
-    Abstract base class for geometry objects.
+    Protocol implemented by all geometry objects. Geometries satisfy it structurally and do not inherit from it.
 
-    Abstract Methods:
+    Protocol Methods:
         to_xml: Converts the geometry object to an XML element.
+        to_xml_bytes: Serializes the geometry object directly to URDF XML bytes.
+        write_to: Writes the URDF XML bytes of the geometry object to a binary stream.
+        to_mjcf: Converts the geometry object to an MJCF element.
+        _write_geom: Writes the geometry attributes onto an existing MJCF geom element.
+        from_xml: Creates the geometry object from an XML element.
+        geometry_type: The type of the geometry.
     """
 
-    @abstractmethod
     def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element: ...
 
-    @abstractmethod
+    def to_xml_bytes(self) -> bytes: ...
+
+    def write_to(self, buf: BinaryIO) -> None: ...
+
     def to_mjcf(self, root: ET.Element) -> None: ...
 
+    def _write_geom(self, geom: ET.Element) -> None: ...
+
     @classmethod
-    @abstractmethod
     def from_xml(cls, element: ET.Element) -> "BaseGeometry": ...
 
     @property
-    @abstractmethod
     def geometry_type(self) -> str: ...
 
 
-@dataclass
-class BoxGeometry(BaseGeometry):
+@dataclass(slots=True, frozen=True)
+class BoxGeometry:
     """
     Represents a box geometry.
 
@@ -102,9 +144,37 @@ class BoxGeometry(BaseGeometry):
             <Element 'geometry' at 0x7f8b3c0b4c70>
         """
         geometry = ET.Element("geometry") if root is None else ET.SubElement(root, "geometry")
-        ET.SubElement(geometry, "box", size=" ".join(format_number(v) for v in self.size))
+        ET.SubElement(geometry, "box", size=_fmt3(*self.size))
         return geometry
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the box geometry directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized geometry element, identical to `ET.tostring(box.to_xml())`.
+
+        Examples:
+            >>> box = BoxGeometry(size=(1.0, 2.0, 3.0))
+            >>> box.to_xml_bytes()
+            b'<geometry><box size="1 2 3"/></geometry>'
+        """
+        return f'<geometry><box size="{_fmt3(*self.size)}"/></geometry>'.encode()
+
+    def write_to(self, buf: BinaryIO) -> None:
+        """
+        Write the URDF XML bytes of the box geometry to a binary stream, without building an element tree.
+
+        Args:
+            buf: The binary stream to write to, e.g. an `io.BytesIO` or a file opened in binary mode.
+
+        Examples:
+            >>> buf = io.BytesIO()
+            >>> box = BoxGeometry(size=(1.0, 2.0, 3.0))
+            >>> box.write_to(buf)
+        """
+        buf.write(self.to_xml_bytes())
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the box geometry to an MJCF element.
@@ -120,9 +190,20 @@ class BoxGeometry(BaseGeometry):
             >>> box.to_mjcf()
             <Element 'geom' at 0x7f8b3c0b4c70>
         """
-        geom = root if root.tag == "geom" else ET.SubElement(root, "geom")
-        geom.set("type", GeometryType.BOX)
-        geom.set("size", " ".join(format_number(v) for v in self.size))
+        self._write_geom(root if root.tag == "geom" else ET.SubElement(root, "geom"))
+
+    def _write_geom(self, geom: ET.Element) -> None:
+        """
+        Write the box attributes onto an existing MJCF `geom` element.
+
+        Callers that already hold a `geom` element, e.g. the visual and collision links, use this directly to skip
+        the tag check done by `to_mjcf`.
+
+        Args:
+            geom: The `geom` element to write to.
+        """
+        geom.set("type", _TYPE_BOX)
+        geom.set("size", _fmt3(*self.size))
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "BoxGeometry":
@@ -144,13 +225,46 @@ class BoxGeometry(BaseGeometry):
         size = tuple(float(v) for v in element.find("box").attrib["size"].split())
         return cls(size)
 
+    @classmethod
+    def from_xml_batch(cls, elements: list[ET.Element]) -> list["BoxGeometry"]:
+        """
+        Create box geometries from several XML elements.
+
+        The size of each box is split and checked for exactly three values. For large batches the values of all
+        boxes are then converted to floats by NumPy in a single call, small batches convert them one by one.
+
+        Args:
+            elements: The XML elements to create the box geometries from.
+
+        Returns:
+            The box geometries created from the XML elements, in the same order.
+
+        Raises:
+            ValueError: If a size does not have exactly three values.
+
+        Examples:
+            >>> element = ET.Element("geometry")
+            >>> ET.SubElement(element, "box", size="1.0 2.0 3.0")
+            >>> BoxGeometry.from_xml_batch([element, element])
+            [BoxGeometry(size=(1.0, 2.0, 3.0)), BoxGeometry(size=(1.0, 2.0, 3.0))]
+        """
+        sizes = [element.find("box").attrib["size"].split() for element in elements]
+        for size in sizes:
+            if len(size) != 3:
+                raise ValueError(f"Each box size must have exactly 3 values, got {' '.join(size)!r}")
+
+        if len(elements) <= _FROM_XML_BATCH_THRESHOLD:
+            return [cls((float(x), float(y), float(z))) for x, y, z in sizes]
+
+        return [cls(tuple(size)) for size in np.array(sizes, dtype=np.float64).tolist()]
+
     @property
     def geometry_type(self) -> str:
         return GeometryType.BOX
 
 
-@dataclass
-class CylinderGeometry(BaseGeometry):
+@dataclass(slots=True, frozen=True)
+class CylinderGeometry:
     """
     Represents a cylinder geometry.
 
@@ -194,6 +308,37 @@ class CylinderGeometry(BaseGeometry):
         )
         return geometry
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the cylinder geometry directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized geometry element, identical to `ET.tostring(cylinder.to_xml())`.
+
+        Examples:
+            >>> cylinder = CylinderGeometry(radius=1.0, length=2.0)
+            >>> cylinder.to_xml_bytes()
+            b'<geometry><cylinder radius="1" length="2"/></geometry>'
+        """
+        return (
+            f'<geometry><cylinder radius="{format_number(self.radius)}" length="{format_number(self.length)}"/>'
+            "</geometry>"
+        ).encode()
+
+    def write_to(self, buf: BinaryIO) -> None:
+        """
+        Write the URDF XML bytes of the cylinder geometry to a binary stream, without building an element tree.
+
+        Args:
+            buf: The binary stream to write to, e.g. an `io.BytesIO` or a file opened in binary mode.
+
+        Examples:
+            >>> buf = io.BytesIO()
+            >>> cylinder = CylinderGeometry(radius=1.0, length=2.0)
+            >>> cylinder.write_to(buf)
+        """
+        buf.write(self.to_xml_bytes())
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the cylinder geometry to an MJCF element.
@@ -209,9 +354,20 @@ class CylinderGeometry(BaseGeometry):
             >>> cylinder.to_mjcf()
             <Element 'geom' at 0x7f8b3c0b4c70>
         """
-        geom = root if root is not None and root.tag == "geom" else ET.SubElement(root, "geom")
-        geom.set("type", GeometryType.CYLINDER)
-        geom.set("size", f"{format_number(self.radius)} {format_number(self.length)}")
+        self._write_geom(root if root.tag == "geom" else ET.SubElement(root, "geom"))
+
+    def _write_geom(self, geom: ET.Element) -> None:
+        """
+        Write the cylinder attributes onto an existing MJCF `geom` element.
+
+        Callers that already hold a `geom` element, e.g. the visual and collision links, use this directly to skip
+        the tag check done by `to_mjcf`.
+
+        Args:
+            geom: The `geom` element to write to.
+        """
+        geom.set("type", _TYPE_CYLINDER)
+        geom.set("size", _fmt2(self.radius, self.length))
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "CylinderGeometry":
@@ -239,8 +395,8 @@ class CylinderGeometry(BaseGeometry):
         return GeometryType.CYLINDER
 
 
-@dataclass
-class SphereGeometry(BaseGeometry):
+@dataclass(slots=True, frozen=True)
+class SphereGeometry:
     """
     Represents a sphere geometry.
 
@@ -277,6 +433,34 @@ class SphereGeometry(BaseGeometry):
         ET.SubElement(geometry, "sphere", radius=format_number(self.radius))
         return geometry
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the sphere geometry directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized geometry element, identical to `ET.tostring(sphere.to_xml())`.
+
+        Examples:
+            >>> sphere = SphereGeometry(radius=1.0)
+            >>> sphere.to_xml_bytes()
+            b'<geometry><sphere radius="1"/></geometry>'
+        """
+        return f'<geometry><sphere radius="{format_number(self.radius)}"/></geometry>'.encode()
+
+    def write_to(self, buf: BinaryIO) -> None:
+        """
+        Write the URDF XML bytes of the sphere geometry to a binary stream, without building an element tree.
+
+        Args:
+            buf: The binary stream to write to, e.g. an `io.BytesIO` or a file opened in binary mode.
+
+        Examples:
+            >>> buf = io.BytesIO()
+            >>> sphere = SphereGeometry(radius=1.0)
+            >>> sphere.write_to(buf)
+        """
+        buf.write(self.to_xml_bytes())
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the sphere geometry to an MJCF element.
@@ -292,8 +476,19 @@ class SphereGeometry(BaseGeometry):
             >>> sphere.to_mjcf()
             <Element 'geom' at 0x7f8b3c0b4c70>
         """
-        geom = root if root is not None and root.tag == "geom" else ET.SubElement(root, "geom")
-        geom.set("type", GeometryType.SPHERE)
+        self._write_geom(root if root.tag == "geom" else ET.SubElement(root, "geom"))
+
+    def _write_geom(self, geom: ET.Element) -> None:
+        """
+        Write the sphere attributes onto an existing MJCF `geom` element.
+
+        Callers that already hold a `geom` element, e.g. the visual and collision links, use this directly to skip
+        the tag check done by `to_mjcf`.
+
+        Args:
+            geom: The `geom` element to write to.
+        """
+        geom.set("type", _TYPE_SPHERE)
         geom.set("size", format_number(self.radius))
 
     @classmethod
@@ -321,8 +516,8 @@ class SphereGeometry(BaseGeometry):
         return GeometryType.SPHERE
 
 
-@dataclass
-class MeshGeometry(BaseGeometry):
+@dataclass(slots=True, frozen=True)
+class MeshGeometry:
     """
     Represents a mesh geometry.
 
@@ -339,6 +534,7 @@ class MeshGeometry(BaseGeometry):
     """
 
     filename: str
+    _mesh_name: str = field(init=False, repr=False, compare=False)
 
     def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
         """
@@ -359,6 +555,36 @@ class MeshGeometry(BaseGeometry):
         ET.SubElement(geometry, "mesh", filename=self.filename)
         return geometry
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the mesh geometry directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized geometry element, identical to `ET.tostring(mesh.to_xml())`.
+
+        Examples:
+            >>> mesh = MeshGeometry(filename="mesh.stl")
+            >>> mesh.to_xml_bytes()
+            b'<geometry><mesh filename="mesh.stl"/></geometry>'
+        """
+        # The filename is already escaped once in __post_init__, lxml escapes attribute values again on output and
+        # writes non-ASCII characters as character references
+        return f'<geometry><mesh filename="{escape(self.filename)}"/></geometry>'.encode("ascii", "xmlcharrefreplace")
+
+    def write_to(self, buf: BinaryIO) -> None:
+        """
+        Write the URDF XML bytes of the mesh geometry to a binary stream, without building an element tree.
+
+        Args:
+            buf: The binary stream to write to, e.g. an `io.BytesIO` or a file opened in binary mode.
+
+        Examples:
+            >>> buf = io.BytesIO()
+            >>> mesh = MeshGeometry(filename="mesh.stl")
+            >>> mesh.write_to(buf)
+        """
+        buf.write(self.to_xml_bytes())
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the mesh geometry to an MJCF element.
@@ -374,8 +600,19 @@ class MeshGeometry(BaseGeometry):
             >>> mesh.to_mjcf()
             <Element 'geom' at 0x7f8b3c0b4c70>
         """
-        geom = root if root is not None and root.tag == "geom" else ET.SubElement(root, "geom")
-        geom.set("type", GeometryType.MESH)
+        self._write_geom(root if root.tag == "geom" else ET.SubElement(root, "geom"))
+
+    def _write_geom(self, geom: ET.Element) -> None:
+        """
+        Write the mesh attributes onto an existing MJCF `geom` element.
+
+        Callers that already hold a `geom` element, e.g. the visual and collision links, use this directly to skip
+        the tag check done by `to_mjcf`.
+
+        Args:
+            geom: The `geom` element to write to.
+        """
+        geom.set("type", _TYPE_MESH)
         geom.set("mesh", self.mesh_name)
 
     @classmethod
@@ -399,7 +636,9 @@ class MeshGeometry(BaseGeometry):
         return cls(filename)
 
     def __post_init__(self) -> None:
-        self.filename = xml_escape(self.filename)
+        # The dataclass is frozen, so the escaped filename has to bypass the generated __setattr__
+        object.__setattr__(self, "filename", xml_escape(self.filename))
+        object.__setattr__(self, "_mesh_name", sys.intern(os.path.splitext(os.path.basename(self.filename))[0]))
 
     @property
     def geometry_type(self) -> str:
@@ -407,5 +646,103 @@ class MeshGeometry(BaseGeometry):
 
     @property
     def mesh_name(self) -> str:
-        file_name_w_ext = os.path.basename(self.filename)
-        return os.path.splitext(file_name_w_ext)[0]
+        return self._mesh_name
+
+
+def emit_batch(geometries: Iterable[BaseGeometry], root: ET.Element) -> list[ET.Element]:
+    """
+    Append the URDF elements of several geometries to a root element in one call.
+
+    Each geometry element is built detached from the tree and all of them are attached with a single
+    `root.extend`, instead of one `ET.SubElement` call on the root per geometry.
+
+    Args:
+        geometries: The geometries to serialize.
+        root: The element to append the geometry elements to.
+
+    Returns:
+        The geometry elements, in the order they were appended.
+
+    Examples:
+        >>> root = ET.Element("visual")
+        >>> emit_batch([BoxGeometry(size=(1.0, 2.0, 3.0)), SphereGeometry(radius=1.0)], root)
+        [<Element geometry at 0x7f8b3c0b4c70>, <Element geometry at 0x7f8b3c0b4d10>]
+    """
+    elements = [geometry.to_xml() for geometry in geometries]
+    root.extend(elements)
+    return elements
+
+
+# Geometries are frozen value objects, so identical ones (e.g. the many copies of a standard fastener, or the visual
+# and collision meshes of the same link) can share a single instance.
+@lru_cache(maxsize=1024)
+def make_box(size: tuple[float, float, float]) -> BoxGeometry:
+    """
+    Get a shared box geometry for the given size.
+
+    Args:
+        size: The size of the box in the x, y, and z dimensions.
+
+    Returns:
+        The box geometry, shared between all calls with the same size.
+
+    Examples:
+        >>> make_box((1.0, 2.0, 3.0)) is make_box((1.0, 2.0, 3.0))
+        True
+    """
+    return BoxGeometry(size)
+
+
+@lru_cache(maxsize=1024)
+def make_cylinder(radius: float, length: float) -> CylinderGeometry:
+    """
+    Get a shared cylinder geometry for the given radius and length.
+
+    Args:
+        radius: The radius of the cylinder.
+        length: The length of the cylinder.
+
+    Returns:
+        The cylinder geometry, shared between all calls with the same radius and length.
+
+    Examples:
+        >>> make_cylinder(1.0, 2.0) is make_cylinder(1.0, 2.0)
+        True
+    """
+    return CylinderGeometry(radius, length)
+
+
+@lru_cache(maxsize=1024)
+def make_sphere(radius: float) -> SphereGeometry:
+    """
+    Get a shared sphere geometry for the given radius.
+
+    Args:
+        radius: The radius of the sphere.
+
+    Returns:
+        The sphere geometry, shared between all calls with the same radius.
+
+    Examples:
+        >>> make_sphere(1.0) is make_sphere(1.0)
+        True
+    """
+    return SphereGeometry(radius)
+
+
+@lru_cache(maxsize=1024)
+def make_mesh(filename: str) -> MeshGeometry:
+    """
+    Get a shared mesh geometry for the given filename.
+
+    Args:
+        filename: The filename of the mesh.
+
+    Returns:
+        The mesh geometry, shared between all calls with the same filename.
+
+    Examples:
+        >>> make_mesh("mesh.stl") is make_mesh("mesh.stl")
+        True
+    """
+    return MeshGeometry(filename)
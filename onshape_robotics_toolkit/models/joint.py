@@ -2,7 +2,8 @@
 This module contains classes for defining joints in a URDF robot model.
 
 Class:
-    - **BaseJoint**: Abstract base class for joint objects.
+    - **JointProto**: Protocol describing the interface shared by all joint classes.
+    - **BaseJoint**: Base class for joint objects.
     - **DummyJoint**: Represents a dummy joint.
     - **RevoluteJoint**: Represents a revolute joint.
     - **ContinuousJoint**: Represents a continuous joint.
@@ -22,12 +23,19 @@ Enum:
     - **JointType**: Enumerates the possible joint types in Onshape (revolute, continuous, prismatic,
       fixed, floating, planar).
 
+Functions:
+    - **make_joint_limits**: Get shared joint limits for the given values.
+    - **make_joint_dynamics**: Get shared joint dynamics for the given values.
+
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter
+from sys import intern
+from typing import Any, Callable, ClassVar, Optional, Protocol
+from xml.sax.saxutils import quoteattr
 
 import lxml.etree as ET
 
@@ -62,17 +70,138 @@ class JointType(str, Enum):
     PLANAR = "planar"
 
 
+# Keyed by the plain string values so lookups with a raw URDF type attribute never go through the enum
 MJCF_JOINT_MAP = {
-    JointType.REVOLUTE: "hinge",
-    JointType.CONTINUOUS: "hinge",
-    JointType.PRISMATIC: "slide",
-    JointType.FIXED: "fixed",
-    JointType.FLOATING: "free",
-    JointType.PLANAR: "slide",
+    JointType.REVOLUTE.value: "hinge",
+    JointType.CONTINUOUS.value: "hinge",
+    JointType.PRISMATIC.value: "slide",
+    JointType.FIXED.value: "fixed",
+    JointType.FLOATING.value: "free",
+    JointType.PLANAR.value: "slide",
 }
 
 
-@dataclass
+def _children_by_tag(element: ET.Element) -> dict[str, ET.Element]:
+    """
+    Map the tags of an element's children to the children, in a single pass over the element.
+
+    If a tag occurs more than once the first child wins, matching `element.find`.
+
+    Args:
+        element: The XML element whose children to map.
+
+    Returns:
+        The children of the element keyed by tag.
+
+    Examples:
+        >>> element = ET.Element("joint")
+        >>> ET.SubElement(element, "parent", link="base_link")
+        >>> _children_by_tag(element)
+        {'parent': <Element parent at 0x7f8b3c0b4c70>}
+    """
+    return {child.tag: child for child in reversed(element)}
+
+
+def _base_joint_from_xml(element: ET.Element) -> tuple[dict[str, ET.Element], tuple[str, str, str, Origin]]:
+    """
+    Parse the fields shared by all joints from a joint element, scanning its children once.
+
+    Args:
+        element: The joint XML element to parse.
+
+    Returns:
+        The children of the element keyed by tag, for parsing the joint-specific sub-elements, and the name,
+        parent, child and origin of the joint, in `BaseJoint` field order.
+
+    Raises:
+        KeyError: If the name attribute or the parent, child or origin element is missing.
+    """
+    children = _children_by_tag(element)
+    # A link is the child of one joint and the parent of the next, so its name is interned to be stored only once
+    return children, (
+        element.attrib["name"],
+        intern(children["parent"].attrib["link"]),
+        intern(children["child"].attrib["link"]),
+        Origin.from_xml(children["origin"]),
+    )
+
+
+# One entry per URDF attribute of a joint sub-element: (field and attribute name, parser, formatter, default).
+# A default of None marks a required attribute. Classes using a schema also define `_SCHEMA_GETTER`, an itemgetter
+# over the attribute names in schema order.
+FieldSchema = tuple[tuple[str, Callable[[str], Any], Callable[[Any], str], Any], ...]
+
+
+def _schema_attrib(obj: Any) -> dict[str, str]:
+    """
+    Format the XML attributes of a joint sub-element dataclass, driven by its `_SCHEMA`.
+
+    Args:
+        obj: The dataclass to format, e.g. a JointLimits.
+
+    Returns:
+        The formatted attributes keyed by name, in schema order.
+    """
+    return {name: format_value(getattr(obj, name)) for name, _, format_value, _ in obj._SCHEMA}
+
+
+def _schema_to_xml(obj: Any, root: Optional[ET.Element] = None) -> ET.Element:
+    """
+    Convert a joint sub-element dataclass to an XML element, driven by its `_TAG` and `_SCHEMA`.
+
+    Args:
+        obj: The dataclass to convert, e.g. a JointLimits.
+        root: The root element to append the element to.
+
+    Returns:
+        The XML element representing the dataclass.
+    """
+    if root is None:
+        return ET.Element(obj._TAG, _schema_attrib(obj))
+    return ET.SubElement(root, obj._TAG, _schema_attrib(obj))
+
+
+def _schema_values(cls: type, element: ET.Element) -> list[Any]:
+    """
+    Parse the XML attributes of a joint sub-element into its field values, driven by the class `_SCHEMA`.
+
+    Args:
+        cls: The dataclass whose schema to parse, e.g. JointLimits.
+        element: The XML element to parse.
+
+    Returns:
+        The parsed field values, in schema order.
+
+    Raises:
+        KeyError: If a required attribute is missing.
+    """
+    attrib = element.attrib
+    try:
+        # Common case: every attribute is present, so all of them are fetched in one C-level call
+        values = cls._SCHEMA_GETTER(attrib)
+    except KeyError:
+        values = [attrib[name] if default is None else attrib.get(name, default) for name, _, _, default in cls._SCHEMA]
+    return [parse(value) for (_, parse, _, _), value in zip(cls._SCHEMA, values)]
+
+
+def _schema_from_xml(cls: type, element: ET.Element) -> Any:
+    """
+    Create a joint sub-element dataclass from an XML element, driven by its `_SCHEMA`.
+
+    Args:
+        cls: The dataclass to create, e.g. JointMimic.
+        element: The XML element to create the dataclass from.
+
+    Returns:
+        The dataclass created from the XML element.
+
+    Raises:
+        KeyError: If a required attribute is missing.
+    """
+    return cls(*_schema_values(cls, element))
+
+
+@dataclass(slots=True, frozen=True)
 class JointLimits:
     """
     Represents the limits of a joint.
@@ -85,6 +214,10 @@ class JointLimits:
 
     Methods:
         to_xml: Converts the joint limits to an XML element.
+        to_xml_root: Converts the joint limits to a new, detached XML element.
+
+    Class Methods:
+        from_xml: Creates joint limits from an XML element.
 
     Examples:
         >>> limits = JointLimits(effort=10.0, velocity=1.0, lower=-1.0, upper=1.0)
@@ -92,6 +225,15 @@ class JointLimits:
         <Element 'limit' at 0x7f8b3c0b4c70>
     """
 
+    _TAG: ClassVar[str] = "limit"
+    _SCHEMA: ClassVar[FieldSchema] = (
+        ("effort", float, format_number, 0),
+        ("velocity", float, format_number, 0),
+        ("lower", float, format_number, 0),
+        ("upper", float, format_number, 0),
+    )
+    _SCHEMA_GETTER: ClassVar[itemgetter] = itemgetter(*(field[0] for field in _SCHEMA))
+
     effort: float
     velocity: float
     lower: float
@@ -113,15 +255,39 @@ class JointLimits:
             <Element 'limit' at 0x7f8b3c0b4c70>
         """
 
-        limit = ET.Element("limit") if root is None else ET.SubElement(root, "limit")
-        limit.set("effort", format_number(self.effort))
-        limit.set("velocity", format_number(self.velocity))
-        limit.set("lower", format_number(self.lower))
-        limit.set("upper", format_number(self.upper))
-        return limit
+        return _schema_to_xml(self, root)
+
+    def to_xml_root(self) -> ET.Element:
+        """
+        Convert the joint limits to a new, detached XML element.
+
+        Returns:
+            The XML element representing the joint limits.
+        """
+
+        return ET.Element(self._TAG, _schema_attrib(self))
+
+    @classmethod
+    def from_xml(cls, element: ET.Element) -> "JointLimits":
+        """
+        Create joint limits from an XML element. Missing attributes default to 0.
+
+        Args:
+            element: The XML element to create the joint limits from.
+
+        Returns:
+            The joint limits created from the XML element.
+
+        Examples:
+            >>> element = ET.Element("limit", effort="10.0", velocity="1.0", lower="-1.0", upper="1.0")
+            >>> JointLimits.from_xml(element)
+            JointLimits(effort=10.0, velocity=1.0, lower=-1.0, upper=1.0)
+        """
+
+        return make_joint_limits(*_schema_values(cls, element))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JointMimic:
     """
     Represents the mimic information for a joint.
@@ -133,6 +299,7 @@ class JointMimic:
 
     Methods:
         to_xml: Converts the mimic information to an XML element.
+        to_xml_root: Converts the mimic information to a new, detached XML element.
 
     Examples:
         >>> mimic = JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
@@ -140,6 +307,14 @@ class JointMimic:
         <Element 'mimic' at 0x7f8b3c0b4c70>
     """
 
+    _TAG: ClassVar[str] = "mimic"
+    _SCHEMA: ClassVar[FieldSchema] = (
+        ("joint", str, str, None),
+        ("multiplier", float, format_number, 1.0),
+        ("offset", float, format_number, 0.0),
+    )
+    _SCHEMA_GETTER: ClassVar[itemgetter] = itemgetter(*(field[0] for field in _SCHEMA))
+
     joint: str
     multiplier: float = 1.0
     offset: float = 0.0
@@ -160,11 +335,17 @@ class JointMimic:
             <Element 'mimic' at 0x7f8b3c0b4c70>
         """
 
-        mimic = ET.Element("mimic") if root is None else ET.SubElement(root, "mimic")
-        mimic.set("joint", self.joint)
-        mimic.set("multiplier", format_number(self.multiplier))
-        mimic.set("offset", format_number(self.offset))
-        return mimic
+        return _schema_to_xml(self, root)
+
+    def to_xml_root(self) -> ET.Element:
+        """
+        Convert the mimic information to a new, detached XML element.
+
+        Returns:
+            The XML element representing the mimic information.
+        """
+
+        return ET.Element(self._TAG, _schema_attrib(self))
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "JointMimic":
@@ -186,13 +367,10 @@ class JointMimic:
             JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
         """
 
-        joint = element.attrib["joint"]
-        multiplier = float(element.attrib.get("multiplier", 1.0))
-        offset = float(element.attrib.get("offset", 0.0))
-        return cls(joint, multiplier, offset)
+        return _schema_from_xml(cls, element)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JointDynamics:
     """
     Represents the dynamics information for a joint.
@@ -203,6 +381,10 @@ class JointDynamics:
 
     Methods:
         to_xml: Converts the dynamics information to an XML element.
+        to_xml_root: Converts the dynamics information to a new, detached XML element.
+
+    Class Methods:
+        from_xml: Creates joint dynamics from an XML element.
 
     Examples:
         >>> dynamics = JointDynamics(damping=0.0, friction=0.0)
@@ -210,6 +392,13 @@ class JointDynamics:
         <Element 'dynamics' at 0x7f8b3c0b4c70>
     """
 
+    _TAG: ClassVar[str] = "dynamics"
+    _SCHEMA: ClassVar[FieldSchema] = (
+        ("damping", float, format_number, 0),
+        ("friction", float, format_number, 0),
+    )
+    _SCHEMA_GETTER: ClassVar[itemgetter] = itemgetter(*(field[0] for field in _SCHEMA))
+
     damping: float
     friction: float
 
@@ -229,11 +418,19 @@ class JointDynamics:
             <Element 'dynamics' at 0x7f8b3c0b4c70>
         """
 
-        joint = ET.Element("dynamics") if root is None else ET.SubElement(root, "dynamics")
-        joint.set("damping", format_number(self.damping))
-        joint.set("friction", format_number(self.friction))
-        return joint
+        return _schema_to_xml(self, root)
+
+    def to_xml_root(self) -> ET.Element:
+        """
+        Convert the dynamics information to a new, detached XML element.
+
+        Returns:
+            The XML element representing the dynamics information.
+        """
+
+        return ET.Element(self._TAG, _schema_attrib(self))
 
+    @classmethod
     def from_xml(cls, element: ET.Element) -> "JointDynamics":
         """
         Create joint dynamics from an XML element.
@@ -252,15 +449,81 @@ class JointDynamics:
             JointDynamics(damping=0.0, friction=0.0)
         """
 
-        damping = float(element.attrib.get("damping", 0))
-        friction = float(element.attrib.get("friction", 0))
-        return cls(damping, friction)
+        return make_joint_dynamics(*_schema_values(cls, element))
+
+
+# Joint limits and dynamics are frozen value objects, and real robots repeat the same values across many joints
+# (e.g. every wheel joint), so identical ones parsed from a URDF share a single instance.
+@lru_cache(maxsize=1024)
+def make_joint_limits(effort: float, velocity: float, lower: float, upper: float) -> JointLimits:
+    """
+    Get shared joint limits for the given values.
+
+    Args:
+        effort: The effort limit of the joint.
+        velocity: The velocity limit of the joint.
+        lower: The lower limit of the joint.
+        upper: The upper limit of the joint.
+
+    Returns:
+        The joint limits, shared between all calls with the same values.
+
+    Examples:
+        >>> make_joint_limits(10.0, 1.0, -1.0, 1.0) is make_joint_limits(10.0, 1.0, -1.0, 1.0)
+        True
+    """
+    return JointLimits(effort, velocity, lower, upper)
 
 
-@dataclass
-class BaseJoint(ABC):
+@lru_cache(maxsize=1024)
+def make_joint_dynamics(damping: float, friction: float) -> JointDynamics:
     """
-    Abstract base class for joint objects.
+    Get shared joint dynamics for the given values.
+
+    Args:
+        damping: The damping coefficient of the joint.
+        friction: The friction coefficient of the joint.
+
+    Returns:
+        The joint dynamics, shared between all calls with the same values.
+
+    Examples:
+        >>> make_joint_dynamics(0.1, 0.0) is make_joint_dynamics(0.1, 0.0)
+        True
+    """
+    return JointDynamics(damping, friction)
+
+
+class JointProto(Protocol):
+    """
+    Protocol describing the interface shared by all joint classes, for consumers that only need to type against it.
+
+    Attributes:
+        name (str): The name of the joint.
+        parent (str): The parent link of the joint.
+        child (str): The child link of the joint.
+        origin (Origin): The origin of the joint.
+        joint_type (str): The URDF type of the joint.
+    """
+
+    name: str
+    parent: str
+    child: str
+    origin: Origin
+    joint_type: ClassVar[str]
+
+    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element: ...
+
+    def to_mjcf(self, root: ET.Element) -> None: ...
+
+    @classmethod
+    def from_xml(cls, element: ET.Element) -> "JointProto": ...
+
+
+@dataclass(slots=True, frozen=True)
+class BaseJoint:
+    """
+    Base class for joint objects. Only the concrete subclasses can be instantiated.
 
     Attributes:
         name (str): The name of the joint.
@@ -270,16 +533,30 @@ class BaseJoint(ABC):
 
     Methods:
         to_xml: Converts the joint to an XML element.
+        to_xml_root: Converts the joint to a new, detached XML element.
+        to_xml_fast: Converts the joint to an XML element by parsing its pre-formatted markup in one call.
+        to_xml_stream: Writes the joint to an incremental `ET.xmlfile` writer.
 
-    Abstract Properties:
-        joint_type: Returns the type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint, set by each subclass.
+        mjcf_type (str): The MJCF type of the joint, set by each subclass that can be exported to MJCF.
     """
 
+    joint_type: ClassVar[str]
+    mjcf_type: ClassVar[str]
+    # Optional sub-elements emitted by `to_xml` after parent/child, in URDF order; set by each subclass
+    _xml_children: ClassVar[tuple[str, ...]] = ()
+
     name: str
     parent: str
     child: str
     origin: Origin
 
+    def __post_init__(self) -> None:
+        # BaseJoint has no joint_type, so reject it here rather than failing later in to_xml
+        if type(self) is BaseJoint:
+            raise TypeError("BaseJoint cannot be instantiated directly, use one of its joint subclasses")
+
     def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
         """
         Convert the joint to an XML element.
@@ -291,14 +568,107 @@ class BaseJoint(ABC):
             The XML element representing the joint.
         """
 
-        joint = ET.Element("joint") if root is None else ET.SubElement(root, "joint")
-        joint.set("name", self.name)
-        joint.set("type", self.joint_type)
+        if root is None:
+            return self.to_xml_root()
+        joint = ET.SubElement(root, "joint", {"name": self.name, "type": self.joint_type})
+        self._write_xml_body(joint)
+        return joint
+
+    def to_xml_root(self) -> ET.Element:
+        """
+        Convert the joint to a new, detached XML element, e.g. the root of a standalone joint document.
+
+        Returns:
+            The XML element representing the joint.
+        """
+
+        joint = ET.Element("joint", {"name": self.name, "type": self.joint_type})
+        self._write_xml_body(joint)
+        return joint
+
+    def _write_xml_body(self, joint: ET.Element) -> None:
+        """
+        Write the origin, parent, child and optional sub-elements of the joint into its `joint` element.
+
+        Args:
+            joint: The `joint` element to write to.
+        """
+
         self.origin.to_xml(joint)
         ET.SubElement(joint, "parent", link=self.parent)
         ET.SubElement(joint, "child", link=self.child)
+        self._write_xml_children(joint)
+
+    def _write_xml_children(self, joint: ET.Element) -> None:
+        """
+        Append the optional sub-elements listed in `_xml_children` that are set on this joint.
+
+        Args:
+            joint: The `joint` element to append to.
+        """
+
+        for field_name in self._xml_children:
+            value = getattr(self, field_name)
+            if value is not None:
+                value.to_xml(joint)
+
+    def to_xml_fast(self, root: Optional[ET.Element] = None) -> ET.Element:
+        """
+        Convert the joint to an XML element, producing the same element as `to_xml`.
+
+        The joint, origin, parent and child elements are written as one markup string and parsed by libxml2 in a
+        single call, instead of one lxml call per element. This pays off for joints without optional sub-elements,
+        e.g. the many fixed joints of a large robot; the optional sub-elements are still appended with `to_xml`.
+
+        Args:
+            root: The root element to append the joint to.
+
+        Returns:
+            The XML element representing the joint.
+
+        Examples:
+            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
+            >>> joint = FixedJoint(name="joint1", parent="base_link", child="link1", origin=origin)
+            >>> joint.to_xml_fast()
+            <Element 'joint' at 0x7f8b3c0b4c70>
+        """
+
+        joint = ET.fromstring(
+            f"<joint name={quoteattr(self.name)} type={quoteattr(self.joint_type)}>"
+            f'<origin xyz="{self.origin.xyz_str}" rpy="{self.origin.rpy_str}"/>'
+            f"<parent link={quoteattr(self.parent)}/><child link={quoteattr(self.child)}/></joint>"
+        )
+        self._write_xml_children(joint)
+        if root is not None:
+            root.append(joint)
         return joint
 
+    def to_xml_stream(self, xf: Any) -> None:
+        """
+        Write the joint to an incremental XML writer, producing the same markup as `to_xml`.
+
+        Only the sub-elements of this joint are held in memory, so a robot with thousands of joints can be written
+        to disk without first building the whole tree.
+
+        Args:
+            xf: The writer yielded by `ET.xmlfile`.
+
+        Examples:
+            >>> with ET.xmlfile("robot.urdf", encoding="utf-8") as xf:
+            ...     with xf.element("robot", name="robot"):
+            ...         for joint in joints:
+            ...             joint.to_xml_stream(xf)
+        """
+
+        with xf.element("joint", {"name": self.name, "type": self.joint_type}):
+            xf.write(self.origin.to_xml())
+            xf.write(ET.Element("parent", link=self.parent))
+            xf.write(ET.Element("child", link=self.child))
+            for field_name in self._xml_children:
+                value = getattr(self, field_name)
+                if value is not None:
+                    xf.write(value.to_xml())
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Converts the joint to an XML element and appends it to the given root element.
@@ -307,25 +677,20 @@ class BaseJoint(ABC):
             root: The root element to append the joint to.
         """
 
-        joint = ET.SubElement(root, "joint", name=self.name, type=MJCF_JOINT_MAP[self.joint_type])
-        joint.set("pos", " ".join(map(str, self.origin.xyz)))
+        joint = ET.SubElement(root, "joint", name=self.name, type=self.mjcf_type)
+        joint.set("pos", self.origin.xyz_str)
 
-    @property
-    @abstractmethod
-    def joint_type(self) -> str: ...
 
-    @classmethod
-    @abstractmethod
-    def from_xml(cls, element: ET.Element) -> "BaseJoint": ...
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DummyJoint(BaseJoint):
     """
-    Represents a dummy joint.
+    Represents a dummy joint. It has no MJCF counterpart.
 
-    Properties:
-        joint_type: The type of the joint.
+    Methods:
+        to_mjcf: Leaves the child body welded to its parent, as MuJoCo does for a body without a joint.
+
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -339,6 +704,16 @@ class DummyJoint(BaseJoint):
         'dummy'
     """
 
+    joint_type: ClassVar[str] = "dummy"
+
+    def to_mjcf(self, root: ET.Element) -> None:
+        """
+        Add nothing to the MJCF body: a body without a joint element is welded to its parent in MuJoCo.
+
+        Args:
+            root: The body element the joint would be appended to.
+        """
+
     @classmethod
     def from_xml(cls, element: ET.Element) -> "DummyJoint":
         """
@@ -362,25 +737,11 @@ class DummyJoint(BaseJoint):
             DummyJoint(name="joint1", parent="base_link", child="link1", origin=Origin(xyz=(0, 0, 0), rpy=(0, 0, 0)))
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
-        return cls(name, parent, child, origin)
-
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
+        _, base = _base_joint_from_xml(element)
+        return cls(*base)
 
-        Returns:
-            The type of the joint: "dummy".
-        """
 
-        return "dummy"
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RevoluteJoint(BaseJoint):
     """
     Represents a revolute joint.
@@ -394,8 +755,9 @@ class RevoluteJoint(BaseJoint):
     Methods:
         to_xml: Converts the revolute joint to an XML element.
 
-    Properties:
-        joint_type: The type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
+        mjcf_type (str): The MJCF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -417,50 +779,14 @@ class RevoluteJoint(BaseJoint):
         <Element 'joint' at 0x7f8b3c0b4c70>
     """
 
-    axis: Axis
-    limits: JointLimits | None = None
-    dynamics: JointDynamics | None = None
-    mimic: JointMimic | None = None
-
-    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
-        """
-        Convert the revolute joint to an XML element.
-
-        Args:
-            root: The root element to append the revolute joint to.
-
-        Returns:
-            The XML element representing the revolute joint.
-
-        Examples:
-            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
-            >>> limits = JointLimits(effort=10.0, velocity=1.0, lower=-1.0, upper=1.0)
-            >>> axis = Axis(xyz=(0, 0, 1))
-            >>> dynamics = JointDynamics(damping=0.0, friction=0.0)
-            >>> mimic = JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
-            >>> joint = RevoluteJoint(
-            ...     name="joint1",
-            ...     parent="base_link",
-            ...     child="link1",
-            ...     origin=origin,
-            ...     limits=limits,
-            ...     axis=axis,
-            ...     dynamics=dynamics,
-            ...     mimic=mimic,
-            ... )
-            >>> joint.to_xml()
-            <Element 'joint' at 0x7f8b3c0b4c70>
-        """
+    joint_type: ClassVar[str] = JointType.REVOLUTE.value
+    mjcf_type: ClassVar[str] = MJCF_JOINT_MAP[joint_type]
+    _xml_children: ClassVar[tuple[str, ...]] = ("axis", "limits", "dynamics", "mimic")
 
-        joint = super().to_xml(root)
-        self.axis.to_xml(joint)
-        if self.limits is not None:
-            self.limits.to_xml(joint)
-        if self.dynamics is not None:
-            self.dynamics.to_xml(joint)
-        if self.mimic is not None:
-            self.mimic.to_xml(joint)
-        return joint
+    axis: Axis
+    limits: Optional[JointLimits] = None
+    dynamics: Optional[JointDynamics] = None
+    mimic: Optional[JointMimic] = None
 
     def to_mjcf(self, root: ET.Element) -> None:
         """
@@ -470,12 +796,12 @@ class RevoluteJoint(BaseJoint):
             root: The root element to append the revolute joint to.
         """
 
-        joint = ET.SubElement(root, "joint", name=self.name, type=MJCF_JOINT_MAP[self.joint_type])
-        joint.set("pos", " ".join(map(str, self.origin.xyz)))
+        joint = ET.SubElement(root, "joint", name=self.name, type=self.mjcf_type)
+        joint.set("pos", self.origin.xyz_str)
 
         self.axis.to_mjcf(joint)
         if self.limits:
-            joint.set("range", " ".join(map(str, [self.limits.lower, self.limits.upper])))
+            joint.set("range", f"{self.limits.lower} {self.limits.upper}")
 
         if self.dynamics:
             joint.set("damping", str(self.dynamics.damping))
@@ -518,63 +844,32 @@ class RevoluteJoint(BaseJoint):
             )
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
+        children, base = _base_joint_from_xml(element)
         # Handle limits
-        limit_element = element.find("limit")
-        if limit_element is not None:
-            limits = JointLimits(
-                effort=float(limit_element.attrib.get("effort", 0)),
-                velocity=float(limit_element.attrib.get("velocity", 0)),
-                lower=float(limit_element.attrib.get("lower", 0)),
-                upper=float(limit_element.attrib.get("upper", 0)),
-            )
-        else:
-            limits = None
+        limit_element = children.get("limit")
+        limits = JointLimits.from_xml(limit_element) if limit_element is not None else None
 
         # Handle axis
-        axis = Axis.from_xml(element.find("axis"))
+        axis = Axis.from_xml(children["axis"])
 
         # Handle dynamics
-        dynamics_element = element.find("dynamics")
-        if dynamics_element is not None:
-            dynamics = JointDynamics(
-                damping=float(dynamics_element.attrib.get("damping", 0)),
-                friction=float(dynamics_element.attrib.get("friction", 0)),
-            )
-        else:
-            dynamics = None
+        dynamics_element = children.get("dynamics")
+        dynamics = JointDynamics.from_xml(dynamics_element) if dynamics_element is not None else None
 
         # Handle mimic
-        mimic_element = element.find("mimic")
+        mimic_element = children.get("mimic")
         mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
 
         return cls(
-            name=name,
-            parent=parent,
-            child=child,
-            origin=origin,
+            *base,
             axis=axis,
             limits=limits,
             dynamics=dynamics,
             mimic=mimic,
         )
 
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
-
-        Returns:
-            The type of the joint: "revolute".
-        """
-
-        return JointType.REVOLUTE
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContinuousJoint(BaseJoint):
     """
     Represents a continuous joint.
@@ -585,8 +880,9 @@ class ContinuousJoint(BaseJoint):
     Methods:
         to_xml: Converts the continuous joint to an XML element.
 
-    Properties:
-        joint_type: The type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
+        mjcf_type (str): The MJCF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -602,39 +898,11 @@ class ContinuousJoint(BaseJoint):
         <Element 'joint' at 0x7f8b3c0b4c70>
     """
 
-    mimic: JointMimic | None = None
-
-    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
-        """
-        Convert the continuous joint to an XML element.
-
-        Args:
-            root: The root element to append the continuous joint to.
-
-        Returns:
-            The XML element representing the continuous joint.
-
-        Examples:
-            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
-            >>> mimic = JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
-            >>> joint = ContinuousJoint(
-            ...     name="joint1",
-            ...     parent="base_link",
-            ...     child="link1",
-            ...     origin=origin,
-            ...     mimic=mimic,
-            ... )
-            >>> joint.to_xml()
-            <Element 'joint' at 0x7f8b3c0b4c70>
-        """
-
-        joint = super().to_xml(root)
-        if self.mimic is not None:
-            self.mimic.to_xml(joint)
-        return joint
+    joint_type: ClassVar[str] = JointType.CONTINUOUS.value
+    mjcf_type: ClassVar[str] = MJCF_JOINT_MAP[joint_type]
+    _xml_children: ClassVar[tuple[str, ...]] = ("mimic",)
 
-    def to_mjcf(self, root):
-        return super().to_mjcf(root)
+    mimic: Optional[JointMimic] = None
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "ContinuousJoint":
@@ -667,30 +935,16 @@ class ContinuousJoint(BaseJoint):
             )
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
+        children, base = _base_joint_from_xml(element)
 
         # Handle mimic
-        mimic_element = element.find("mimic")
+        mimic_element = children.get("mimic")
         mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
 
-        return cls(name, parent, child, origin, mimic)
-
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
-
-        Returns:
-            The type of the joint: "continuous".
-        """
-
-        return JointType.CONTINUOUS
+        return cls(*base, mimic)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrismaticJoint(BaseJoint):
     """
     Represents a prismatic joint.
@@ -704,8 +958,9 @@ class PrismaticJoint(BaseJoint):
     Methods:
         to_xml: Converts the prismatic joint to an XML element.
 
-    Properties:
-        joint_type: The type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
+        mjcf_type (str): The MJCF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -727,50 +982,14 @@ class PrismaticJoint(BaseJoint):
         <Element 'joint' at 0x7f8b3c0b4c70>
     """
 
+    joint_type: ClassVar[str] = JointType.PRISMATIC.value
+    mjcf_type: ClassVar[str] = MJCF_JOINT_MAP[joint_type]
+    _xml_children: ClassVar[tuple[str, ...]] = ("axis", "limits", "dynamics", "mimic")
+
     limits: JointLimits
     axis: Axis
-    dynamics: JointDynamics | None = None
-    mimic: JointMimic | None = None
-
-    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
-        """
-        Convert the prismatic joint to an XML element.
-
-        Args:
-            root: The root element to append the prismatic joint to.
-
-        Returns:
-            The XML element representing the prismatic joint
-
-        Examples:
-            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
-            >>> limits = JointLimits(effort=10.0, velocity=1.0, lower=-1.0, upper=1.0)
-            >>> axis = Axis(xyz=(0, 0, 1))
-            >>> dynamics = JointDynamics(damping=0.0, friction=0.0)
-            >>> mimic = JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
-            >>> joint = PrismaticJoint(
-            ...     name="joint1",
-            ...     parent="base_link",
-            ...     child="link1",
-            ...     origin=origin,
-            ...     limits=limits,
-            ...     axis=axis,
-            ...     dynamics=dynamics,
-            ...     mimic=mimic,
-            ... )
-            >>> joint.to_xml()
-            <Element 'joint' at 0x7f8b3c0b4c70>
-        """
-
-        joint = super().to_xml(root)
-        self.axis.to_xml(joint)
-        if self.limits is not None:
-            self.limits.to_xml(joint)
-        if self.dynamics is not None:
-            self.dynamics.to_xml(joint)
-        if self.mimic is not None:
-            self.mimic.to_xml(joint)
-        return joint
+    dynamics: Optional[JointDynamics] = None
+    mimic: Optional[JointMimic] = None
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "PrismaticJoint":
@@ -809,51 +1028,23 @@ class PrismaticJoint(BaseJoint):
             )
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
-
-        limit_element = element.find("limit")
-        if limit_element is not None:
-            limits = JointLimits(
-                effort=float(limit_element.attrib.get("effort", 0)),
-                velocity=float(limit_element.attrib.get("velocity", 0)),
-                lower=float(limit_element.attrib.get("lower", 0)),
-                upper=float(limit_element.attrib.get("upper", 0)),
-            )
-        else:
-            limits = None
-
-        axis = Axis.from_xml(element.find("axis"))
+        children, base = _base_joint_from_xml(element)
 
-        dynamics_element = element.find("dynamics")
-        if dynamics_element is not None:
-            dynamics = JointDynamics(
-                damping=float(dynamics_element.attrib.get("damping", 0)),
-                friction=float(dynamics_element.attrib.get("friction", 0)),
-            )
-        else:
-            dynamics = None
+        limit_element = children.get("limit")
+        limits = JointLimits.from_xml(limit_element) if limit_element is not None else None
 
-        mimic_element = element.find("mimic")
-        mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
+        axis = Axis.from_xml(children["axis"])
 
-        return cls(name, parent, child, origin, limits, axis, dynamics, mimic)
+        dynamics_element = children.get("dynamics")
+        dynamics = JointDynamics.from_xml(dynamics_element) if dynamics_element is not None else None
 
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
-
-        Returns:
-            The type of the joint: "prismatic".
-        """
+        mimic_element = children.get("mimic")
+        mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
 
-        return JointType.PRISMATIC
+        return cls(*base, limits, axis, dynamics, mimic)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FixedJoint(BaseJoint):
     """
     Represents a fixed joint.
@@ -861,8 +1052,9 @@ class FixedJoint(BaseJoint):
     Methods:
         to_xml: Converts the fixed joint to an XML element.
 
-    Properties:
-        joint_type: The type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
+        mjcf_type (str): The MJCF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -876,30 +1068,8 @@ class FixedJoint(BaseJoint):
         <Element 'joint' at 0x7f8b3c0b4c70>
     """
 
-    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
-        """
-        Convert the fixed joint to an XML element.
-
-        Args:
-            root: The root element to append the fixed joint to.
-
-        Returns:
-            The XML element representing the fixed joint.
-
-        Examples:
-            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
-            >>> joint = FixedJoint(
-            ...     name="joint1",
-            ...     parent="base_link",
-            ...     child="link1",
-            ...     origin=origin,
-            ... )
-            >>> joint.to_xml()
-            <Element 'joint' at 0x7f8b3c0b4c70>
-        """
-
-        joint = super().to_xml(root)
-        return joint
+    joint_type: ClassVar[str] = JointType.FIXED.value
+    mjcf_type: ClassVar[str] = MJCF_JOINT_MAP[joint_type]
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "FixedJoint":
@@ -925,25 +1095,11 @@ class FixedJoint(BaseJoint):
             FixedJoint(name="joint1", parent="base_link", child="link1", origin=Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
-        return cls(name, parent, child, origin)
+        _, base = _base_joint_from_xml(element)
+        return cls(*base)
 
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
-
-        Returns:
-            The type of the joint: "fixed".
-        """
-
-        return JointType.FIXED
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FloatingJoint(BaseJoint):
     """
     Represents a floating joint.
@@ -954,8 +1110,9 @@ class FloatingJoint(BaseJoint):
     Methods:
         to_xml: Converts the floating joint to an XML element.
 
-    Properties:
-        joint_type: The type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
+        mjcf_type (str): The MJCF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -971,36 +1128,11 @@ class FloatingJoint(BaseJoint):
         <Element 'joint' at 0x7f8b3c0b4c70>
     """
 
-    mimic: JointMimic | None = None
-
-    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
-        """
-        Convert the floating joint to an XML element.
-
-        Args:
-            root: The root element to append the floating joint to.
-
-        Returns:
-            The XML element representing the floating joint.
-
-        Examples:
-            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
-            >>> mimic = JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
-            >>> joint = FloatingJoint(
-            ...     name="joint1",
-            ...     parent="base_link",
-            ...     child="link1",
-            ...     origin=origin,
-            ...     mimic=mimic,
-            ... )
-            >>> joint.to_xml()
-            <Element 'joint' at 0x7f8b3c0b4c70>
-        """
+    joint_type: ClassVar[str] = JointType.FLOATING.value
+    mjcf_type: ClassVar[str] = MJCF_JOINT_MAP[joint_type]
+    _xml_children: ClassVar[tuple[str, ...]] = ("mimic",)
 
-        joint = super().to_xml(root)
-        if self.mimic is not None:
-            self.mimic.to_xml(joint)
-        return joint
+    mimic: Optional[JointMimic] = None
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "FloatingJoint":
@@ -1033,29 +1165,15 @@ class FloatingJoint(BaseJoint):
             )
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
+        children, base = _base_joint_from_xml(element)
 
-        mimic_element = element.find("mimic")
+        mimic_element = children.get("mimic")
         mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
 
-        return cls(name, parent, child, origin, mimic)
+        return cls(*base, mimic)
 
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
-
-        Returns:
-            The type of the joint: "floating".
-        """
-
-        return JointType.FLOATING
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanarJoint(BaseJoint):
     """
     Represents a planar joint.
@@ -1068,8 +1186,9 @@ class PlanarJoint(BaseJoint):
     Methods:
         to_xml: Converts the planar joint to an XML element.
 
-    Properties:
-        joint_type: The type of the joint.
+    Class Attributes:
+        joint_type (str): The URDF type of the joint.
+        mjcf_type (str): The MJCF type of the joint.
 
     Examples:
         >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
@@ -1089,45 +1208,13 @@ class PlanarJoint(BaseJoint):
         <Element 'joint' at 0x7f8b3c0b4c70>
     """
 
+    joint_type: ClassVar[str] = JointType.PLANAR.value
+    mjcf_type: ClassVar[str] = MJCF_JOINT_MAP[joint_type]
+    _xml_children: ClassVar[tuple[str, ...]] = ("axis", "limits", "mimic")
+
     limits: JointLimits
     axis: Axis
-    mimic: JointMimic | None = None
-
-    def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
-        """
-        Convert the planar joint to an XML element.
-
-        Args:
-            root: The root element to append the planar joint to.
-
-        Returns:
-            The XML element representing the planar joint.
-
-        Examples:
-            >>> origin = Origin(xyz=(0, 0, 0), rpy=(0, 0, 0))
-            >>> limits = JointLimits(effort=10.0, velocity=1.0, lower=-1.0, upper=1.0)
-            >>> axis = Axis(xyz=(0, 0, 1))
-            >>> mimic = JointMimic(joint="joint1", multiplier=1.0, offset=0.0)
-            >>> joint = PlanarJoint(
-            ...     name="joint1",
-            ...     parent="base_link",
-            ...     child="link1",
-            ...     origin=origin,
-            ...     limits=limits,
-            ...     axis=axis,
-            ...     mimic=mimic,
-            ... )
-            >>> joint.to_xml()
-            <Element 'joint' at 0x7f8b3c0b4c70>
-        """
-
-        joint = super().to_xml(root)
-        self.axis.to_xml(joint)
-        if self.limits is not None:
-            self.limits.to_xml(joint)
-        if self.mimic is not None:
-            self.mimic.to_xml(joint)
-        return joint
+    mimic: Optional[JointMimic] = None
 
     @classmethod
     def from_xml(cls, element: ET.Element) -> "PlanarJoint":
@@ -1164,36 +1251,21 @@ class PlanarJoint(BaseJoint):
             )
         """
 
-        name = element.attrib["name"]
-        parent = element.find("parent").attrib["link"]
-        child = element.find("child").attrib["link"]
-        origin = Origin.from_xml(element.find("origin"))
-
-        limit_element = element.find("limit")
-        if limit_element is not None:
-            limits = JointLimits(
-                effort=float(limit_element.attrib.get("effort", 0)),
-                velocity=float(limit_element.attrib.get("velocity", 0)),
-                lower=float(limit_element.attrib.get("lower", 0)),
-                upper=float(limit_element.attrib.get("upper", 0)),
-            )
-        else:
-            limits = None
+        children, base = _base_joint_from_xml(element)
 
-        axis = Axis.from_xml(element.find("axis"))
+        limit_element = children.get("limit")
+        limits = JointLimits.from_xml(limit_element) if limit_element is not None else None
 
-        mimic_element = element.find("mimic")
-        mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
+        axis = Axis.from_xml(children["axis"])
 
-        return cls(name, parent, child, origin, limits, axis, mimic)
+        mimic_element = children.get("mimic")
+        mimic = JointMimic.from_xml(mimic_element) if mimic_element is not None else None
 
-    @property
-    def joint_type(self) -> str:
-        """
-        The type of the joint.
+        return cls(*base, limits, axis, mimic)
 
-        Returns:
-            The type of the joint: "planar".
-        """
 
-        return JointType.PLANAR
+# Keyed by the URDF type attribute, like MJCF_JOINT_MAP, so a parsed joint element is routed with one dict lookup
+JOINT_FROM_XML: dict[str, Callable[[ET.Element], BaseJoint]] = {
+    joint_class.joint_type: joint_class.from_xml
+    for joint_class in (RevoluteJoint, ContinuousJoint, PrismaticJoint, FixedJoint, FloatingJoint, PlanarJoint)
+}
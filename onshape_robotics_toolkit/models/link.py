@@ -11,18 +11,24 @@ Dataclass:
     - **CollisionLink**: Represents the collision properties of a link in the robot model.
     - **Link**: Represents a link in the robot model.
 
-Enum:
-    - **Colors**: Enumerates the possible colors for a link in the robot model.
+Class:
+    - **Colors**: Namespace of the predefined RGBA colors for a link in the robot model.
+
+Functions:
+    - **transform_origins**: Apply a transformation matrix to many origins in place at once.
+    - **make_axis**: Get a shared axis for the given direction vector.
+    - **make_material**: Get a shared material for the given name and color.
 """
 
+import math
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Callable, Optional, Union
+from xml.sax.saxutils import quoteattr
 
 import numpy as np
 from lxml import etree as ET
 from scipy.spatial.transform import Rotation
-from scipy.spatial.transform import Rotation as R
 
 from onshape_robotics_toolkit.models.geometry import (
     BaseGeometry,
@@ -34,11 +40,95 @@ from onshape_robotics_toolkit.models.geometry import (
 from onshape_robotics_toolkit.utilities import format_number
 
 
-class Colors(tuple[float, float, float], Enum):
+def _quote_attr(value: str) -> str:
+    """
+    Escape and quote an attribute value exactly as lxml serializes it, always using double quotes.
+    """
+    return quoteattr(value, {'"': "&quot;"})
+
+
+# Keyed on the values rather than on an Origin, so the cache never goes stale when an origin is updated in place
+@lru_cache(maxsize=4096)
+def _format_vector(values: tuple[float, ...]) -> str:
+    """
+    Format a vector as a space-separated string of numbers, e.g. the xyz of an origin.
+    """
+    return " ".join(format_number(v) for v in values)
+
+
+# URDFs repeat the same few vectors (e.g. "0 0 0" origins and "0 0 1" axes) across many joints and links
+@lru_cache(maxsize=4096)
+def _parse_vector(text: str) -> tuple[float, ...]:
+    """
+    Parse a space-separated string of numbers into a vector, e.g. the xyz attribute of an origin.
+    """
+    return tuple(map(float, text.split()))
+
+
+def _euler_xyz_from_elements(
+    m00: float, m10: float, m11: float, m12: float, m20: float, m21: float, m22: float
+) -> tuple[float, float, float]:
+    """
+    Convert the elements of a rotation matrix that determine its xyz Euler angles to roll, pitch, yaw angles.
+
+    At gimbal lock (pitch of +/-90 degrees) the yaw is set to zero, as SciPy does.
     """
-    Enumerates the possible colors in RGBA format for a link in the robot model.
+    cos_pitch = math.hypot(m00, m10)
+    pitch = math.atan2(-m20, cos_pitch)
+    if cos_pitch < 1e-9:
+        return math.atan2(-m12, m11), pitch, 0.0
+    return math.atan2(m21, m22), pitch, math.atan2(m10, m00)
+
+
+def _euler_xyz_from_matrix(matrix: np.ndarray) -> tuple[float, float, float]:
+    """
+    Convert a rotation matrix to roll, pitch, yaw angles, equivalent to `Rotation.from_matrix(matrix).as_euler("xyz")`.
+    """
+    (m00, _, _), (m10, m11, m12), (m20, m21, m22) = matrix.tolist()
+    return _euler_xyz_from_elements(m00, m10, m11, m12, m20, m21, m22)
+
 
-    Each color is represented as a tuple of four float values (r, g, b, a),
+def _transform_xyz_rpy(
+    xyz: tuple[float, float, float], rpy: tuple[float, float, float], matrix: np.ndarray
+) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+    """
+    Apply a 4x4 transformation matrix to a position and its roll, pitch, yaw angles.
+
+    Equivalent to `R @ xyz + t` and `Rotation.from_matrix(R @ Rotation.from_euler("xyz", rpy).as_matrix())`, but
+    computed on plain floats: for a single 3-vector and 3x3 matrix, numpy's per-call overhead costs far more than
+    the arithmetic itself.
+    """
+    (a00, a01, a02, tx), (a10, a11, a12, ty), (a20, a21, a22, tz) = matrix[:3].tolist()
+    x, y, z = xyz
+    new_xyz = (a00 * x + a01 * y + a02 * z + tx, a10 * x + a11 * y + a12 * z + ty, a20 * x + a21 * y + a22 * z + tz)
+
+    # Rotation matrix of the current angles, as in Rotation.from_euler("xyz", rpy).as_matrix()
+    roll, pitch, yaw = rpy
+    sr, cr = math.sin(roll), math.cos(roll)
+    sp, cp = math.sin(pitch), math.cos(pitch)
+    sy, cy = math.sin(yaw), math.cos(yaw)
+    b00, b01, b02 = cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr
+    b10, b11, b12 = sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr
+    b20, b21, b22 = -sp, cp * sr, cp * cr
+
+    # Only the elements of the composed rotation that determine its Euler angles are needed
+    new_rpy = _euler_xyz_from_elements(
+        a00 * b00 + a01 * b10 + a02 * b20,
+        a10 * b00 + a11 * b10 + a12 * b20,
+        a10 * b01 + a11 * b11 + a12 * b21,
+        a10 * b02 + a11 * b12 + a12 * b22,
+        a20 * b00 + a21 * b10 + a22 * b20,
+        a20 * b01 + a21 * b11 + a22 * b21,
+        a20 * b02 + a21 * b12 + a22 * b22,
+    )
+    return new_xyz, new_rpy
+
+
+class Colors:
+    """
+    Namespace of the predefined colors in RGBA format for a link in the robot model.
+
+    Each color is a plain tuple of four float values (r, g, b, a),
     where each component ranges from 0.0 to 1.0.
 
     Attributes:
@@ -52,11 +142,12 @@ class Colors(tuple[float, float, float], Enum):
         BLACK (tuple[float, float, float, float]): Color black (0, 0, 0, 1).
         ORANGE (tuple[float, float, float, float]): Color orange (1, 0.5, 0, 1).
         PINK (tuple[float, float, float, float]): Color pink (1, 0, 0.5, 1).
+        ALL (tuple[tuple[float, float, float, float], ...]): Every predefined color, in the order above.
 
     Examples:
         >>> Colors.RED
-        <Colors.RED: (1.0, 0.0, 0.0, 1.0)>
-        >>> Colors.BLUE.value
+        (1.0, 0.0, 0.0, 1.0)
+        >>> random.choice(Colors.ALL)
         (0.0, 0.0, 1.0, 1.0)
     """
 
@@ -71,8 +162,10 @@ class Colors(tuple[float, float, float], Enum):
     ORANGE = (1.0, 0.5, 0.0, 1.0)
     PINK = (1.0, 0.0, 0.5, 1.0)
 
+    ALL = (RED, GREEN, BLUE, YELLOW, CYAN, MAGENTA, WHITE, BLACK, ORANGE, PINK)
 
-@dataclass
+
+@dataclass(slots=True)
 class Origin:
     """
     Represents the origin of a link in the robot model.
@@ -84,9 +177,14 @@ class Origin:
     Methods:
         transform: Applies a transformation matrix to the origin.
         to_xml: Converts the origin to an XML element.
+        to_xml_bytes: Serializes the origin directly to URDF XML bytes.
         to_mjcf: Converts the origin to a MuJoCo compatible XML element.
         quat: Converts the origin's rotation to a quaternion.
 
+    Properties:
+        xyz_str: The formatted xyz coordinates of the origin.
+        rpy_str: The formatted roll, pitch, yaw angles of the origin.
+
     Class Methods:
         from_xml: Creates an origin from an XML element.
         from_matrix: Creates an origin from a transformation matrix.
@@ -97,7 +195,7 @@ class Origin:
         >>> origin.to_xml()
         <Element 'origin' at 0x7f8b3c0b4c70>
 
-        >>> matrix = np.matrix([
+        >>> matrix = np.array([
         ...     [1, 0, 0, 0],
         ...     [0, 1, 0, 0],
         ...     [0, 0, 1, 0],
@@ -110,12 +208,12 @@ class Origin:
     xyz: tuple[float, float, float]
     rpy: tuple[float, float, float]
 
-    def transform(self, matrix: np.matrix, inplace: bool = False) -> Union["Origin", None]:
+    def transform(self, matrix: np.ndarray, inplace: bool = False) -> Union["Origin", None]:
         """
         Apply a transformation matrix to the origin.
 
         Args:
-            matrix (np.matrix): The 4x4 transformation matrix to apply.
+            matrix (np.ndarray): The 4x4 transformation matrix to apply.
             inplace (bool): If True, modifies the current origin. If False, returns a new Origin.
 
         Returns:
@@ -128,14 +226,10 @@ class Origin:
             >>> new_origin = origin.transform(matrix)  # Returns new Origin
             >>> origin.transform(matrix, inplace=True)  # Modifies origin in place
         """
-        new_xyz = np.dot(matrix[:3, :3], np.array(self.xyz)) + matrix[:3, 3]
-        current_rotation_matrix = Rotation.from_euler("xyz", self.rpy).as_matrix()
-
-        new_rotation_matrix = np.dot(matrix[:3, :3], current_rotation_matrix)
-        new_rpy = Rotation.from_matrix(new_rotation_matrix).as_euler("xyz")
+        new_xyz, new_rpy = _transform_xyz_rpy(self.xyz, self.rpy, matrix)
         if inplace:
-            self.xyz = tuple(new_xyz)
-            self.rpy = tuple(new_rpy)
+            self.xyz = new_xyz
+            self.rpy = new_rpy
             return None
 
         return Origin(new_xyz, new_rpy)
@@ -157,10 +251,24 @@ class Origin:
         """
 
         origin = ET.Element("origin") if root is None else ET.SubElement(root, "origin")
-        origin.set("xyz", " ".join(format_number(v) for v in self.xyz))
-        origin.set("rpy", " ".join(format_number(v) for v in self.rpy))
+        origin.set("xyz", self.xyz_str)
+        origin.set("rpy", self.rpy_str)
         return origin
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the origin directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized origin element, identical to `ET.tostring(origin.to_xml())`.
+
+        Examples:
+            >>> origin = Origin(xyz=(1.0, 2.0, 3.0), rpy=(0.0, 0.0, 0.0))
+            >>> origin.to_xml_bytes()
+            b'<origin xyz="1 2 3" rpy="0 0 0"/>'
+        """
+        return f'<origin xyz="{self.xyz_str}" rpy="{self.rpy_str}"/>'.encode()
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the origin to a MuJoCo compatible XML element.
@@ -178,8 +286,25 @@ class Origin:
             >>> element.get('euler')
             '0.0 0.0 0.0'
         """
-        root.set("pos", " ".join(format_number(v) for v in self.xyz))
-        root.set("euler", " ".join(format_number(v) for v in self.rpy))
+        root.set("pos", self.xyz_str)
+        root.set("euler", self.rpy_str)
+
+    @property
+    def xyz_str(self) -> str:
+        """
+        The xyz coordinates of the origin as written to URDF and MJCF, e.g. "1 2 3".
+
+        The formatted string is cached on the coordinate values, so exporting the same origin to both URDF and MJCF,
+        or many origins at the same position, formats the numbers only once.
+        """
+        return _format_vector(tuple(self.xyz))
+
+    @property
+    def rpy_str(self) -> str:
+        """
+        The roll, pitch, yaw angles of the origin as written to URDF and MJCF, e.g. "0 0 1.5707963".
+        """
+        return _format_vector(tuple(self.rpy))
 
     @classmethod
     def from_xml(cls, xml: ET.Element) -> "Origin":
@@ -198,8 +323,8 @@ class Origin:
             Origin(xyz=(0.0, 0.0, 0.0), rpy=(0.0, 0.0, 0.0))
         """
 
-        xyz = tuple(map(float, xml.get("xyz").split()))
-        rpy = tuple(map(float, xml.get("rpy").split()))
+        xyz = _parse_vector(xml.get("xyz"))
+        rpy = _parse_vector(xml.get("rpy"))
         return cls(xyz, rpy)
 
     def quat(self, sequence: str = "xyz") -> np.ndarray:
@@ -217,10 +342,23 @@ class Origin:
             >>> origin.quat()
             array([0.70710678, 0.        , 0.        , 0.70710678])
         """
-        return Rotation.from_euler(sequence, self.rpy).as_quat()
+        if sequence != "xyz":
+            return Rotation.from_euler(sequence, self.rpy).as_quat()
+
+        # Closed form of the URDF sequence, identical to Rotation.from_euler("xyz", self.rpy).as_quat()
+        roll, pitch, yaw = self.rpy
+        sr, cr = math.sin(roll / 2), math.cos(roll / 2)
+        sp, cp = math.sin(pitch / 2), math.cos(pitch / 2)
+        sy, cy = math.sin(yaw / 2), math.cos(yaw / 2)
+        return np.array([
+            sr * cp * cy - cr * sp * sy,
+            cr * sp * cy + sr * cp * sy,
+            cr * cp * sy - sr * sp * cy,
+            cr * cp * cy + sr * sp * sy,
+        ])
 
     @classmethod
-    def from_matrix(cls, matrix: np.matrix) -> "Origin":
+    def from_matrix(cls, matrix: np.ndarray) -> "Origin":
         """
         Create an origin from a transformation matrix.
 
@@ -231,7 +369,7 @@ class Origin:
             The origin created from the transformation matrix.
 
         Examples:
-            >>> matrix = np.matrix([
+            >>> matrix = np.array([
             ...     [1, 0, 0, 0],
             ...     [0, 1, 0, 0],
             ...     [0, 0, 1, 0],
@@ -241,10 +379,9 @@ class Origin:
             Origin(xyz=(0.0, 0.0, 0.0), rpy=(0.0, 0.0, 0.0))
         """
 
-        x = float(matrix[0, 3])
-        y = float(matrix[1, 3])
-        z = float(matrix[2, 3])
-        roll, pitch, yaw = Rotation.from_matrix(matrix[:3, :3]).as_euler("xyz")
+        matrix = np.asarray(matrix)
+        x, y, z = matrix[:3, 3].tolist()
+        roll, pitch, yaw = _euler_xyz_from_matrix(matrix[:3, :3])
         return cls((x, y, z), (roll, pitch, yaw))
 
     @classmethod
@@ -263,7 +400,43 @@ class Origin:
         return cls((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
 
 
-@dataclass
+def transform_origins(origins: list[Origin], matrix: np.ndarray) -> None:
+    """
+    Apply a transformation matrix to many origins in place, e.g. to move all links of a subassembly at once.
+
+    The result is the same as calling `origin.transform(matrix, inplace=True)` on each origin, but the positions and
+    rotations of all origins are transformed with one vectorized numpy call each, instead of once per origin.
+
+    Args:
+        origins: The origins to transform.
+        matrix: The 4x4 transformation matrix to apply.
+
+    Examples:
+        >>> origins = [Origin(xyz=(1.0, 0.0, 0.0), rpy=(0.0, 0.0, 0.0)), Origin.zero_origin()]
+        >>> matrix = np.eye(4)
+        >>> matrix[:3, 3] = (0.0, 0.0, 1.0)
+        >>> transform_origins(origins, matrix)
+        >>> origins[0]
+        Origin(xyz=(1.0, 0.0, 1.0), rpy=(0.0, 0.0, 0.0))
+    """
+    if not origins:
+        return
+
+    matrix = np.asarray(matrix)
+    rotation_matrix = matrix[:3, :3]
+    xyz = np.array([origin.xyz for origin in origins], dtype=float)
+    rpy = np.array([origin.rpy for origin in origins], dtype=float)
+
+    new_xyz = xyz @ rotation_matrix.T + matrix[:3, 3]
+    new_rotation_matrices = rotation_matrix @ Rotation.from_euler("xyz", rpy).as_matrix()
+    new_rpy = Rotation.from_matrix(new_rotation_matrices).as_euler("xyz")
+
+    for origin, origin_xyz, origin_rpy in zip(origins, new_xyz.tolist(), new_rpy.tolist()):
+        origin.xyz = tuple(origin_xyz)
+        origin.rpy = tuple(origin_rpy)
+
+
+@dataclass(slots=True, frozen=True)
 class Axis:
     """
     Represents the axis of rotation or translation for a joint in the robot model.
@@ -274,8 +447,12 @@ class Axis:
 
     Methods:
         to_xml: Converts the axis to an XML element.
+        to_xml_bytes: Serializes the axis directly to URDF XML bytes.
         to_mjcf: Converts the axis to a MuJoCo compatible XML element.
 
+    Properties:
+        xyz_str: The formatted direction vector of the axis.
+
     Class Methods:
         from_xml: Creates an axis from an XML element.
 
@@ -310,9 +487,23 @@ class Axis:
         """
 
         axis = ET.Element("axis") if root is None else ET.SubElement(root, "axis")
-        axis.set("xyz", " ".join(format_number(v) for v in self.xyz))
+        axis.set("xyz", self.xyz_str)
         return axis
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the axis directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized axis element, identical to `ET.tostring(axis.to_xml())`.
+
+        Examples:
+            >>> axis = Axis(xyz=(1.0, 0.0, 0.0))
+            >>> axis.to_xml_bytes()
+            b'<axis xyz="1 0 0"/>'
+        """
+        return f'<axis xyz="{self.xyz_str}"/>'.encode()
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the axis to an MuJoCo compatible XML element.
@@ -328,7 +519,14 @@ class Axis:
             >>> axis.to_mjcf()
             <Element 'axis' at 0x7f8b3c0b4c70>
         """
-        root.set("axis", " ".join(format_number(v) for v in self.xyz))
+        root.set("axis", self.xyz_str)
+
+    @property
+    def xyz_str(self) -> str:
+        """
+        The direction vector of the axis as written to URDF and MJCF, e.g. "0 0 1".
+        """
+        return _format_vector(tuple(self.xyz))
 
     @classmethod
     def from_xml(cls, xml: ET.Element) -> "Axis":
@@ -346,11 +544,32 @@ class Axis:
             >>> Axis.from_xml(xml)
             Axis(xyz=(0.0, 0.0, 0.0))
         """
-        xyz = tuple(map(float, xml.get("xyz").split()))
-        return cls(xyz)
+        xyz = _parse_vector(xml.get("xyz"))
+        return make_axis(xyz)
 
 
-@dataclass
+# Axes and materials are frozen value objects, and robots reuse a handful of them (e.g. "0 0 1" axes or a "grey"
+# material) across many joints and links, so identical ones share a single instance. Origins and inertias are
+# updated in place by the transforms, so they are never shared.
+@lru_cache(maxsize=1024)
+def make_axis(xyz: tuple[float, float, float]) -> Axis:
+    """
+    Get a shared axis for the given direction vector.
+
+    Args:
+        xyz: The direction vector of the axis.
+
+    Returns:
+        The axis, shared between all calls with the same direction vector.
+
+    Examples:
+        >>> make_axis((0.0, 0.0, 1.0)) is make_axis((0.0, 0.0, 1.0))
+        True
+    """
+    return Axis(xyz)
+
+
+@dataclass(slots=True)
 class Inertia:
     """
     Represents the inertia tensor of a link in the robot model.
@@ -368,6 +587,7 @@ class Inertia:
 
     Methods:
         to_xml: Converts the inertia tensor to an XML element.
+        to_xml_bytes: Serializes the inertia tensor directly to URDF XML bytes.
         to_mjcf: Converts the inertia tensor to a MuJoCo compatible XML element.
         to_matrix: Returns the inertia tensor as a 3x3 numpy array.
 
@@ -415,6 +635,24 @@ class Inertia:
         inertia.set("iyz", format_number(self.iyz))
         return inertia
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the inertia tensor directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized inertia element, identical to `ET.tostring(inertia.to_xml())`.
+
+        Examples:
+            >>> inertia = Inertia(ixx=1.0, iyy=2.0, izz=3.0, ixy=0.0, ixz=0.0, iyz=0.0)
+            >>> inertia.to_xml_bytes()
+            b'<inertia ixx="1" iyy="2" izz="3" ixy="0" ixz="0" iyz="0"/>'
+        """
+        return (
+            f'<inertia ixx="{format_number(self.ixx)}" iyy="{format_number(self.iyy)}" '
+            f'izz="{format_number(self.izz)}" ixy="{format_number(self.ixy)}" '
+            f'ixz="{format_number(self.ixz)}" iyz="{format_number(self.iyz)}"/>'
+        ).encode()
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the inertia tensor to an MuJoCo compatible XML element.
@@ -431,7 +669,7 @@ class Inertia:
             <Element 'inertia' at 0x7f8b3c0b4c70>
         """
         inertial = root if root.tag == "inertial" else ET.SubElement(root, "inertial")
-        inertial.set("diaginertia", " ".join(format_number(v) for v in [self.ixx, self.iyy, self.izz]))
+        inertial.set("diaginertia", f"{format_number(self.ixx)} {format_number(self.iyy)} {format_number(self.izz)}")
 
     @classmethod
     def from_xml(cls, xml: ET.Element) -> "Inertia":
@@ -486,7 +724,7 @@ class Inertia:
         ])
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Material:
     """
     Represents the material properties of a link in the robot model.
@@ -501,11 +739,12 @@ class Material:
 
     Methods:
         to_xml: Converts the material properties to an XML element.
+        to_xml_bytes: Serializes the material properties directly to URDF XML bytes.
         to_mjcf: Converts the material to a MuJoCo compatible XML element.
 
     Class Methods:
         from_xml: Creates a material from an XML element.
-        from_color: Creates a material from a predefined Colors enum value.
+        from_color: Creates a material from a predefined Colors value.
 
     Examples:
         >>> material = Material(name="red_material", color=(1.0, 0.0, 0.0, 1.0))
@@ -538,9 +777,25 @@ class Material:
 
         material = ET.Element("material") if root is None else ET.SubElement(root, "material")
         material.set("name", self.name)
-        ET.SubElement(material, "color", rgba=" ".join(format_number(v) for v in self.color))
+        ET.SubElement(material, "color", rgba=_format_vector(tuple(self.color)))
         return material
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the material properties directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized material element, identical to `ET.tostring(material.to_xml())`.
+
+        Examples:
+            >>> material = Material(name="material", color=(1.0, 0.0, 0.0, 1.0))
+            >>> material.to_xml_bytes()
+            b'<material name="material"><color rgba="1 0 0 1"/></material>'
+        """
+        return (
+            f'<material name={_quote_attr(self.name)}><color rgba="{_format_vector(tuple(self.color))}"/></material>'
+        ).encode()
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the material properties to an MuJoCo compatible XML element.
@@ -557,7 +812,7 @@ class Material:
             <Element 'material' at 0x7f8b3c0b4c70>
         """
         geom = root if root is not None and root.tag == "geom" else ET.SubElement(root, "geom")
-        geom.set("rgba", " ".join(format_number(v) for v in self.color))
+        geom.set("rgba", _format_vector(tuple(self.color)))
 
     @classmethod
     def from_xml(cls, xml: ET.Element) -> "Material":
@@ -577,17 +832,17 @@ class Material:
         """
 
         name = xml.get("name")
-        color = tuple(map(float, xml.find("color").get("rgba").split()))
-        return cls(name, color)
+        color = _parse_vector(xml.find("color").get("rgba"))
+        return make_material(name, color)
 
     @classmethod
-    def from_color(cls, name: str, color: Colors) -> "Material":
+    def from_color(cls, name: str, color: tuple[float, float, float, float]) -> "Material":
         """
         Create a material from a color.
 
         Args:
             name: The name of the material.
-            color: The color of the material.
+            color: The RGBA color of the material, e.g. one of the `Colors` values.
 
         Returns:
             The material created from the color.
@@ -599,7 +854,26 @@ class Material:
         return cls(name, color)
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def make_material(name: str, color: tuple[float, float, float, float]) -> Material:
+    """
+    Get a shared material for the given name and color.
+
+    Args:
+        name: The name of the material.
+        color: The RGBA color of the material.
+
+    Returns:
+        The material, shared between all calls with the same name and color.
+
+    Examples:
+        >>> make_material("grey", (0.5, 0.5, 0.5, 1.0)) is make_material("grey", (0.5, 0.5, 0.5, 1.0))
+        True
+    """
+    return Material(name, color)
+
+
+@dataclass(slots=True)
 class InertialLink:
     """
     Represents the inertial properties of a link in the robot model.
@@ -614,6 +888,7 @@ class InertialLink:
 
     Methods:
         to_xml: Converts the inertial properties to an XML element.
+        to_xml_bytes: Serializes the inertial properties directly to URDF XML bytes.
         to_mjcf: Converts the inertial properties to a MuJoCo compatible XML element.
         transform: Applies a transformation matrix to the inertial properties.
 
@@ -659,6 +934,29 @@ class InertialLink:
         self.origin.to_xml(inertial)
         return inertial
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the inertial properties directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized inertial element, identical to `ET.tostring(inertial.to_xml())`.
+
+        Examples:
+            >>> inertial = InertialLink(
+            ...     mass=1.0,
+            ...     inertia=Inertia(1.0, 1.0, 1.0, 0.0, 0.0, 0.0),
+            ...     origin=Origin.zero_origin()
+            ... )
+            >>> inertial.to_xml_bytes()
+            b'<inertial><mass value="1"/><inertia .../><origin .../></inertial>'
+        """
+        return b"".join((
+            f'<inertial><mass value="{format_number(self.mass)}"/>'.encode(),
+            self.inertia.to_xml_bytes(),
+            self.origin.to_xml_bytes(),
+            b"</inertial>",
+        ))
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the inertial properties to an MuJoCo compatible XML element.
@@ -676,7 +974,7 @@ class InertialLink:
         self.origin.to_mjcf(inertial)
         self.inertia.to_mjcf(inertial)
 
-    def transform(self, tf_matrix: np.matrix, inplace: bool = False) -> Union["InertialLink", None]:
+    def transform(self, tf_matrix: np.ndarray, inplace: bool = False) -> Union["InertialLink", None]:
         """
         Apply a transformation matrix to the Inertial Properties of the a link.
 
@@ -702,6 +1000,7 @@ class InertialLink:
             Ref: https://chatgpt.com/share/6781b6ac-772c-8006-b1a9-7f2dc3e3ef4d
         """
 
+        tf_matrix = np.asarray(tf_matrix)
         R = tf_matrix[:3, :3]  # Top-left 3x3 block is the rotation matrix
         p = tf_matrix[:3, 3]   # Top-right 3x1 block is the translation vector
 
@@ -766,6 +1065,14 @@ class InertialLink:
         return cls(mass=mass, inertia=inertia, origin=origin)
 
 
+GEOMETRY_FROM_XML: dict[str, Callable[[ET.Element], BaseGeometry]] = {
+    "mesh": MeshGeometry.from_xml,
+    "box": BoxGeometry.from_xml,
+    "cylinder": CylinderGeometry.from_xml,
+    "sphere": SphereGeometry.from_xml,
+}
+
+
 def set_geometry_from_xml(geometry: ET.Element) -> BaseGeometry | None:
     """
     Set the geometry from an XML element.
@@ -776,19 +1083,15 @@ def set_geometry_from_xml(geometry: ET.Element) -> BaseGeometry | None:
     Returns:
         The geometry created from the XML element.
     """
-    if geometry.find("mesh") is not None:
-        return MeshGeometry.from_xml(geometry)
-    elif geometry.find("box"):
-        return BoxGeometry.from_xml(geometry)
-    elif geometry.find("length") and geometry.find("radius"):
-        return CylinderGeometry.from_xml(geometry)
-    elif geometry.find("radius"):
-        return SphereGeometry.from_xml(geometry)
+    for child in geometry:
+        geometry_from_xml = GEOMETRY_FROM_XML.get(child.tag)
+        if geometry_from_xml is not None:
+            return geometry_from_xml(geometry)
 
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualLink:
     """
     Represents the visual properties of a link in the robot model.
@@ -804,6 +1107,7 @@ class VisualLink:
 
     Methods:
         to_xml: Converts the visual properties to an XML element.
+        to_xml_bytes: Serializes the visual properties directly to URDF XML bytes.
         to_mjcf: Converts the visual properties to a MuJoCo compatible XML element.
         transform: Applies a transformation matrix to the visual geometry's origin.
 
@@ -833,16 +1137,7 @@ class VisualLink:
         Args:
             transformation_matrix (np.ndarray): A 4x4 transformation matrix (homogeneous).
         """
-        # Apply translation and rotation to the origin position
-        pos = np.array([self.origin.xyz[0], self.origin.xyz[1], self.origin.xyz[2], 1])
-        new_pos = transformation_matrix @ pos
-        self.origin.xyz = tuple(new_pos[:3])  # Update position
-
-        # Extract the rotation from the transformation matrix
-        rotation_matrix = transformation_matrix[:3, :3]
-        current_rotation = R.from_euler("xyz", self.origin.rpy)
-        new_rotation = R.from_matrix(rotation_matrix @ current_rotation.as_matrix())
-        self.origin.rpy = new_rotation.as_euler("xyz").tolist()
+        self.origin.transform(transformation_matrix, inplace=True)
 
     def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
         """
@@ -872,6 +1167,31 @@ class VisualLink:
         self.material.to_xml(visual)
         return visual
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the visual properties directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized visual element, identical to `ET.tostring(visual.to_xml())`.
+
+        Examples:
+            >>> visual = VisualLink(
+            ...     name="link_visual",
+            ...     origin=Origin.zero_origin(),
+            ...     geometry=BoxGeometry(size=(1.0, 1.0, 1.0)),
+            ...     material=Material.from_color("red", Colors.RED)
+            ... )
+            >>> visual.to_xml_bytes()
+            b'<visual name="link_visual"><origin .../><geometry>...</geometry><material ...>...</material></visual>'
+        """
+        return b"".join((
+            f"<visual name={_quote_attr(self.name)}>".encode() if self.name else b"<visual>",
+            self.origin.to_xml_bytes(),
+            self.geometry.to_xml_bytes(),
+            self.material.to_xml_bytes(),
+            b"</visual>",
+        ))
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the visual properties to an MuJoCo compatible XML element.
@@ -899,7 +1219,7 @@ class VisualLink:
         self.origin.to_mjcf(visual)
 
         if self.geometry:
-            self.geometry.to_mjcf(visual)
+            self.geometry._write_geom(visual)
 
         self.material.to_mjcf(visual)
 
@@ -937,7 +1257,7 @@ class VisualLink:
         return cls(name=name, origin=origin, geometry=geometry, material=material)
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionLink:
     """
     Represents the collision properties of a link in the robot model.
@@ -954,6 +1274,7 @@ class CollisionLink:
 
     Methods:
         to_xml: Converts the collision properties to an XML element.
+        to_xml_bytes: Serializes the collision properties directly to URDF XML bytes.
         to_mjcf: Converts the collision properties to a MuJoCo compatible XML element.
         transform: Applies a transformation matrix to the collision geometry's origin.
 
@@ -978,21 +1299,12 @@ class CollisionLink:
 
     def transform(self, transformation_matrix: np.ndarray) -> None:
         """
-        Apply a transformation to the visual link's origin.
+        Apply a transformation to the collision link's origin.
 
         Args:
             transformation_matrix (np.ndarray): A 4x4 transformation matrix (homogeneous).
         """
-        # Apply translation and rotation to the origin position
-        pos = np.array([self.origin.xyz[0], self.origin.xyz[1], self.origin.xyz[2], 1])
-        new_pos = transformation_matrix @ pos
-        self.origin.xyz = tuple(new_pos[:3])  # Update position
-
-        # Extract the rotation from the transformation matrix
-        rotation_matrix = transformation_matrix[:3, :3]
-        current_rotation = R.from_euler("xyz", self.origin.rpy)
-        new_rotation = R.from_matrix(rotation_matrix @ current_rotation.as_matrix())
-        self.origin.rpy = new_rotation.as_euler("xyz").tolist()
+        self.origin.transform(transformation_matrix, inplace=True)
 
     def to_xml(self, root: Optional[ET.Element] = None) -> ET.Element:
         """
@@ -1016,6 +1328,25 @@ class CollisionLink:
         self.geometry.to_xml(collision)
         return collision
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the collision properties directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized collision element, identical to `ET.tostring(collision.to_xml())`.
+
+        Examples:
+            >>> collision = CollisionLink(origin=Origin(...), geometry=BoxGeometry(...))
+            >>> collision.to_xml_bytes()
+            b'<collision><origin .../><geometry>...</geometry></collision>'
+        """
+        return b"".join((
+            f"<collision name={_quote_attr(self.name)}>".encode() if self.name else b"<collision>",
+            self.origin.to_xml_bytes(),
+            self.geometry.to_xml_bytes(),
+            b"</collision>",
+        ))
+
     def to_mjcf(self, root: ET.Element) -> None:
         """
         Convert the collision properties to an MuJoCo compatible XML element.
@@ -1052,12 +1383,12 @@ class CollisionLink:
         self.origin.to_mjcf(collision)
 
         if self.geometry:
-            self.geometry.to_mjcf(collision)
+            self.geometry._write_geom(collision)
 
         collision.set("group", "0")
 
         if self.friction:
-            collision.set("friction", " ".join(format_number(v) for v in self.friction))
+            collision.set("friction", _format_vector(tuple(self.friction)))
 
     @classmethod
     def from_xml(cls, xml: ET.Element) -> "CollisionLink":
@@ -1086,7 +1417,7 @@ class CollisionLink:
         return cls(name=name, origin=origin, geometry=geometry)
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     """
     Represents a complete link in the robot model.
@@ -1103,6 +1434,7 @@ class Link:
 
     Methods:
         to_xml: Converts the link to an XML element.
+        to_xml_bytes: Serializes the link directly to URDF XML bytes.
         to_mjcf: Converts the link to a MuJoCo compatible XML element.
 
     Class Methods:
@@ -1154,16 +1486,31 @@ class Link:
             >>> link.to_xml()
             <Element 'link' at 0x...>
         """
-        link = ET.Element("link") if root is None else ET.SubElement(root, "link")
-        link.set("name", self.name)
-        if self.visual is not None:
-            self.visual.to_xml(link)
-        if self.collision is not None:
-            self.collision.to_xml(link)
-        if self.inertial is not None:
-            self.inertial.to_xml(link)
+        # Parse the serialized link once instead of creating and filling every sub-element through lxml
+        link = ET.fromstring(self.to_xml_bytes())
+        if root is not None:
+            root.append(link)
         return link
 
+    def to_xml_bytes(self) -> bytes:
+        """
+        Serialize the link directly to URDF XML bytes, without building an element tree.
+
+        Returns:
+            The serialized link element, identical to `ET.tostring(link.to_xml())`.
+
+        Examples:
+            >>> link = Link(name="base_link")
+            >>> link.to_xml_bytes()
+            b'<link name="base_link"/>'
+        """
+        children = [
+            element.to_xml_bytes() for element in (self.visual, self.collision, self.inertial) if element is not None
+        ]
+        if not children:
+            return f"<link name={_quote_attr(self.name)}/>".encode()
+        return b"".join((f"<link name={_quote_attr(self.name)}>".encode(), *children, b"</link>"))
+
     def to_mjcf(self, root: Optional[ET.Element] = None) -> ET.Element:
         """
         Convert the link to an MuJoCo compatible XML element.
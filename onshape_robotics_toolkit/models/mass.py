@@ -98,8 +98,8 @@ class MassProperties(BaseModel):
     Properties:
         principal_inertia: The principal inertia as a numpy array.
         center_of_mass: The center of mass as a tuple of three floats.
-        inertia_matrix: The inertia matrix as a 3x3 numpy matrix.
-        principal_axes: The principal axes as a 3x3 numpy matrix.
+        inertia_matrix: The inertia matrix as a 3x3 numpy array.
+        principal_axes: The principal axes as a 3x3 numpy array.
 
     Methods:
         principal_axes_wrt: Returns the principal axes with respect to a given reference frame.
@@ -171,26 +171,26 @@ class MassProperties(BaseModel):
         return (self.centroid[0], self.centroid[1], self.centroid[2])
 
     @property
-    def inertia_matrix(self) -> np.matrix:
+    def inertia_matrix(self) -> np.ndarray:
         """
-        Returns the inertia matrix as a 3x3 numpy matrix.
+        Returns the inertia matrix as a 3x3 numpy array.
 
         Returns:
             The inertia matrix.
         """
-        return np.matrix(np.array(self.inertia[:9]).reshape(3, 3))
+        return np.array(self.inertia[:9]).reshape(3, 3)
 
     @property
-    def principal_axes(self) -> np.matrix:
+    def principal_axes(self) -> np.ndarray:
         """
-        Returns the principal axes as a 3x3 numpy matrix.
+        Returns the principal axes as a 3x3 numpy array.
 
         Returns:
             The principal axes.
         """
-        return np.matrix(np.array([axis.values for axis in self.principalAxes]))
+        return np.array([axis.values for axis in self.principalAxes])
 
-    def principal_axes_wrt(self, reference: np.matrix) -> np.matrix:
+    def principal_axes_wrt(self, reference: np.ndarray) -> np.ndarray:
         """
         Returns the principal axes with respect to a given reference frame.
 
@@ -212,7 +212,7 @@ class MassProperties(BaseModel):
 
         return reference @ self.principal_axes
 
-    def inertia_wrt(self, reference: np.matrix) -> np.matrix:
+    def inertia_wrt(self, reference: np.ndarray) -> np.ndarray:
         """
         Returns the inertia matrix with respect to a given reference frame.
 
@@ -234,7 +234,7 @@ class MassProperties(BaseModel):
 
         return reference @ self.inertia_matrix @ reference.T
 
-    def center_of_mass_wrt(self, reference: np.matrix) -> np.ndarray:
+    def center_of_mass_wrt(self, reference: np.ndarray) -> np.ndarray:
         """
         Returns the center of mass with respect to a given reference frame.
 
@@ -254,6 +254,5 @@ class MassProperties(BaseModel):
         if reference.shape != (4, 4):
             raise ValueError("Reference frame must be a 4x4 matrix")
 
-        com = np.matrix([*list(self.center_of_mass), 1.0])
-        com_wrt = (reference * com.T)[:3]
-        return np.array([com_wrt[0, 0], com_wrt[1, 0], com_wrt[2, 0]])
+        com = np.array([*self.center_of_mass, 1.0])
+        return (np.asarray(reference) @ com)[:3]
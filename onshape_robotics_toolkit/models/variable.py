@@ -47,6 +47,10 @@ class VARIABLE_TYPE(str, Enum):
     ANY = "ANY"
 
 
+# Valid variable type values, str-Enum members hash and compare equal to their values
+_VARIABLE_TYPE_VALUES = frozenset(VARIABLE_TYPE)
+
+
 class Variable(BaseModel):
     """
     Represents a variable used in Onshape's Variable Studio.
@@ -90,8 +94,8 @@ class Variable(BaseModel):
     type: str = Field(..., description="The type of the variable (LENGTH, ANGLE, NUMBER, ANY)")
     name: str = Field(..., description="The name of the variable")
     value: Union[str, None] = Field(None, description="The value of the variable")
-    description: str = Field(None, description="The description of the variable")
-    expression: str = Field(None, description="The expression of the variable")
+    description: Union[str, None] = Field(None, description="The description of the variable")
+    expression: Union[str, None] = Field(None, description="The expression of the variable")
 
     @field_validator("name")
     def validate_name(cls, value: str) -> str:
@@ -126,7 +130,7 @@ class Variable(BaseModel):
         Raises:
             ValueError: If the variable type is not one of the valid types.
         """
-        if value not in VARIABLE_TYPE.__members__.values():
+        if value not in _VARIABLE_TYPE_VALUES:
             raise ValueError(f"Invalid variable type: {value}")
 
         return value
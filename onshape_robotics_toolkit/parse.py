@@ -536,8 +536,6 @@ async def process_features_async(  # noqa: C901
     relations_map: dict[str, MateRelationFeatureData] = {}
 
     for feature in features:
-        feature.featureData.id = feature.id
-
         if feature.suppressed:
             continue
 
@@ -562,7 +560,7 @@ async def process_features_async(  # noqa: C901
             if parent_occurrences[0] in rigid_subassemblies:
                 _occurrence = rigid_subassembly_occurrence_map[parent_occurrences[0]].get(parent_occurrences[1])
                 if _occurrence:
-                    parent_parentCS = MatedCS.from_tf(np.matrix(_occurrence.transform).reshape(4, 4))
+                    parent_parentCS = MatedCS.from_tf(np.asarray(_occurrence.transform, dtype=np.float64).reshape(4, 4))
                     parts[parent_occurrences[0]].rigidAssemblyToPartTF[parent_occurrences[1]] = parent_parentCS.part_tf
                     feature.featureData.matedEntities[PARENT].parentCS = parent_parentCS
                 parent_occurrences = [parent_occurrences[0]]
@@ -570,7 +568,7 @@ async def process_features_async(  # noqa: C901
             if child_occurrences[0] in rigid_subassemblies:
                 _occurrence = rigid_subassembly_occurrence_map[child_occurrences[0]].get(child_occurrences[1])
                 if _occurrence:
-                    child_parentCS = MatedCS.from_tf(np.matrix(_occurrence.transform).reshape(4, 4))
+                    child_parentCS = MatedCS.from_tf(np.asarray(_occurrence.transform, dtype=np.float64).reshape(4, 4))
                     parts[child_occurrences[0]].rigidAssemblyToPartTF[child_occurrences[1]] = child_parentCS.part_tf
                     feature.featureData.matedEntities[CHILD].parentCS = child_parentCS
                 child_occurrences = [child_occurrences[0]]
@@ -8,6 +8,7 @@ Dataclass:
 
 import asyncio
 import os
+from collections.abc import Iterator
 from enum import Enum
 from typing import Any, Optional
 
@@ -24,32 +25,21 @@ from onshape_robotics_toolkit.models.assembly import (
     MateFeatureData,
     MateRelationFeatureData,
     Part,
-    RelationType,
     RootAssembly,
     SubAssembly,
 )
 from onshape_robotics_toolkit.models.document import Document
-from onshape_robotics_toolkit.models.joint import (
-    BaseJoint,
-    ContinuousJoint,
-    FixedJoint,
-    FloatingJoint,
-    JointMimic,
-    JointType,
-    PrismaticJoint,
-    RevoluteJoint,
-)
+from onshape_robotics_toolkit.models.joint import JOINT_FROM_XML, BaseJoint
 from onshape_robotics_toolkit.models.link import Link
 from onshape_robotics_toolkit.models.mjcf import Actuator, Encoder, ForceSensor, Light, Sensor
 from onshape_robotics_toolkit.parse import (
     MATE_JOINER,
-    RELATION_PARENT,
     get_instances,
     get_mates_and_relations,
     get_parts,
     get_subassemblies,
 )
-from onshape_robotics_toolkit.urdf import get_joint_name, get_robot_joint, get_robot_link, get_topological_mates
+from onshape_robotics_toolkit.urdf import get_joint_mimic, get_robot_joint, get_robot_link, get_topological_mates
 from onshape_robotics_toolkit.utilities.helpers import format_number
 
 DEFAULT_COMPILER_ATTRIBUTES = {
@@ -93,18 +83,8 @@ def set_joint_from_xml(element: ET.Element) -> BaseJoint | None:
         >>> set_joint_from_xml(element)
         <FixedJoint>
     """
-    joint_type = element.attrib["type"]
-    if joint_type == JointType.FIXED:
-        return FixedJoint.from_xml(element)
-    elif joint_type == JointType.REVOLUTE:
-        return RevoluteJoint.from_xml(element)
-    elif joint_type == JointType.CONTINUOUS:
-        return ContinuousJoint.from_xml(element)
-    elif joint_type == JointType.PRISMATIC:
-        return PrismaticJoint.from_xml(element)
-    elif joint_type == JointType.FLOATING:
-        return FloatingJoint.from_xml(element)
-    return None
+    from_xml = JOINT_FROM_XML.get(element.attrib["type"])
+    return from_xml(element) if from_xml is not None else None
 
 
 class Robot:
@@ -789,13 +769,13 @@ class Robot:
         Returns:
             The robot model.
         """
-        tree: ET.ElementTree = ET.parse(file_name)  # noqa: S320
-        root: ET.Element = tree.getroot()
+        elements = iter_urdf_elements(file_name)
+        root = next(elements)
 
         name = root.attrib["name"]
         robot = cls(name=name, robot_type=robot_type)
 
-        for element in root:
+        for element in elements:
             if element.tag == "link":
                 link = Link.from_xml(element)
                 robot.add_link(link)
@@ -913,6 +893,41 @@ class Robot:
         return robot
 
 
+def iter_urdf_elements(file_name: str) -> Iterator[ET.Element]:
+    """
+    Stream the top-level link and joint elements of a URDF file without loading the whole tree.
+
+    The root element is yielded first, then each top-level `link` and `joint` element once it has been parsed in
+    full. An element is cleared and dropped from the tree when the next one is requested, so only one link or
+    joint is held in memory at a time; copy out anything needed before advancing the iterator.
+
+    Args:
+        file_name: The path to the URDF file.
+
+    Yields:
+        The root element, followed by the top-level link and joint elements in document order.
+
+    Examples:
+        >>> elements = iter_urdf_elements("robot.urdf")
+        >>> root = next(elements)
+        >>> joints = [set_joint_from_xml(element) for element in elements if element.tag == "joint"]
+    """
+    context = ET.iterparse(file_name, events=("start", "end"), tag=("robot", "link", "joint"))  # noqa: S320
+    _, root = next(context)
+    yield root
+
+    for event, element in context:
+        # Links and joints also appear nested, e.g. the joint of a transmission, which stay with their parent
+        if event == "start" or element.getparent() is not root:
+            continue
+
+        yield element
+
+        element.clear()
+        while element.getprevious() is not None:
+            del root[0]
+
+
 def load_element(file_name: str) -> ET.Element:
     """
     Load an XML element from a file.
@@ -983,16 +998,7 @@ def get_robot(
         joint_mimic = None
         relation = topological_relations.get(topological_mates[mate_key].id)
         if relation:
-            multiplier = (
-                relation.relationLength
-                if relation.relationType == RelationType.RACK_AND_PINION
-                else relation.relationRatio
-            )
-            joint_mimic = JointMimic(
-                joint=get_joint_name(relation.mates[RELATION_PARENT].featureId, mates),
-                multiplier=multiplier,
-                offset=0.0,
-            )
+            joint_mimic = get_joint_mimic(relation, mates)
 
         joint_list, link_list = get_robot_joint(
             parent,
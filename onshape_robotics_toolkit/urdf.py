@@ -19,7 +19,7 @@ from onshape_robotics_toolkit.models.assembly import (
     Part,
 )
 from onshape_robotics_toolkit.models.document import WorkspaceType
-from onshape_robotics_toolkit.models.geometry import MeshGeometry
+from onshape_robotics_toolkit.models.geometry import make_mesh
 from onshape_robotics_toolkit.models.joint import (
     BaseJoint,
     DummyJoint,
@@ -31,7 +31,6 @@ from onshape_robotics_toolkit.models.joint import (
     RevoluteJoint,
 )
 from onshape_robotics_toolkit.models.link import (
-    Axis,
     CollisionLink,
     Colors,
     Inertia,
@@ -40,8 +39,9 @@ from onshape_robotics_toolkit.models.link import (
     Material,
     Origin,
     VisualLink,
+    make_axis,
 )
-from onshape_robotics_toolkit.parse import CHILD, MATE_JOINER, PARENT
+from onshape_robotics_toolkit.parse import CHILD, MATE_JOINER, PARENT, RELATION_PARENT
 from onshape_robotics_toolkit.utilities.helpers import get_sanitized_name
 
 SCRIPT_DIR = os.path.dirname(__file__)
@@ -62,13 +62,42 @@ def get_joint_name(mate_id: str, mates: dict[str, MateFeatureData]) -> str:
     return reverse_mates.get(mate_id)
 
 
+def get_joint_mimic(relation: MateRelationFeatureData, mates: dict[str, MateFeatureData]) -> Optional[JointMimic]:
+    """
+    Generate a URDF joint mimic from an Onshape mate relation.
+
+    The multiplier is the relation length if the relation carries one, e.g. a rack and pinion, and its ratio
+    otherwise. A relation that carries neither has no valid multiplier and yields no mimic.
+
+    Args:
+        relation: The mate relation.
+        mates: The dictionary of mates in the assembly.
+
+    Returns:
+        The joint mimic, or None if the relation has neither a length nor a ratio.
+    """
+    if relation.has_length:
+        multiplier = relation.relationLength
+    elif relation.has_ratio:
+        multiplier = relation.relationRatio
+    else:
+        LOGGER.warning(f"Mate relation {relation.name} has neither a ratio nor a length, skipping the joint mimic.")
+        return None
+
+    return JointMimic(
+        joint=get_joint_name(relation.mates[RELATION_PARENT].featureId, mates),
+        multiplier=multiplier,
+        offset=0.0,
+    )
+
+
 def get_robot_link(
     name: str,
     part: Part,
     wid: str,
     client: Client,
     mate: Optional[Union[MateFeatureData, None]] = None,
-) -> tuple[Link, np.matrix, Asset]:
+) -> tuple[Link, np.ndarray, Asset]:
     """
     Generate a URDF link from an Onshape part.
 
@@ -80,14 +109,14 @@ def get_robot_link(
         mate: MateFeatureData object to use for generating the transformation matrix.
 
     Returns:
-        tuple[Link, np.matrix]: The generated link object
+        tuple[Link, np.ndarray]: The generated link object
             and the transformation matrix from the STL origin to the link origin.
 
     Examples:
         >>> get_robot_link("root", part, wid, client)
         (
             Link(name='root', visual=VisualLink(...), collision=CollisionLink(...), inertial=InertialLink(...)),
-            np.matrix([[1., 0., 0., 0.],
+            array([[1., 0., 0., 0.],
                 [0., 1., 0., 0.],
                 [0., 0., 1., 0.],
                 [0., 0., 0., 1.]])
@@ -103,11 +132,11 @@ def get_robot_link(
     else:
         _link_to_stl_tf = mate.matedEntities[CHILD].matedCS.part_to_mate_tf
 
-    _stl_to_link_tf = np.matrix(np.linalg.inv(_link_to_stl_tf))
+    _stl_to_link_tf = np.linalg.inv(_link_to_stl_tf)
     _mass = part.MassProperty.mass[0]
     _origin = Origin.zero_origin()
     _com = part.MassProperty.center_of_mass_wrt(_stl_to_link_tf)
-    _inertia = part.MassProperty.inertia_wrt(np.matrix(_stl_to_link_tf[:3, :3]))
+    _inertia = part.MassProperty.inertia_wrt(_stl_to_link_tf[:3, :3])
     _principal_axes_rotation = (0.0, 0.0, 0.0)
 
     LOGGER.info(f"Creating robot link for {name}")
@@ -142,8 +171,8 @@ def get_robot_link(
         visual=VisualLink(
             name=f"{name}_visual",
             origin=_origin,
-            geometry=MeshGeometry(_mesh_path),
-            material=Material.from_color(name=f"{name}-material", color=random.SystemRandom().choice(list(Colors))),
+            geometry=make_mesh(_mesh_path),
+            material=Material.from_color(name=f"{name}-material", color=random.SystemRandom().choice(Colors.ALL)),
         ),
         inertial=InertialLink(
             origin=Origin(
@@ -163,7 +192,7 @@ def get_robot_link(
         collision=CollisionLink(
             name=f"{name}_collision",
             origin=_origin,
-            geometry=MeshGeometry(_mesh_path),
+            geometry=make_mesh(_mesh_path),
         ),
     )
 
@@ -174,7 +203,7 @@ def get_robot_joint(
     parent: str,
     child: str,
     mate: MateFeatureData,
-    stl_to_parent_tf: np.matrix,
+    stl_to_parent_tf: np.ndarray,
     mimic: Optional[JointMimic] = None,
     is_rigid_assembly: bool = False,
 ) -> tuple[list[BaseJoint], Optional[list[Link]]]:
@@ -239,7 +268,7 @@ def get_robot_joint(
                     lower=-2 * np.pi,
                     upper=2 * np.pi,
                 ),
-                axis=Axis((0.0, 0.0, -1.0)),
+                axis=make_axis((0.0, 0.0, -1.0)),
                 # dynamics=JointDynamics(damping=0.1, friction=0.1),
                 mimic=mimic,
             )
@@ -261,7 +290,7 @@ def get_robot_joint(
                 #     lower=-0.1,
                 #     upper=0.1,
                 # ),
-                axis=Axis((0.0, 0.0, -1.0)),
+                axis=make_axis((0.0, 0.0, -1.0)),
                 # dynamics=JointDynamics(damping=0.1, friction=0.1),
                 mimic=mimic,
             )
@@ -299,7 +328,7 @@ def get_robot_joint(
                     lower=-2 * np.pi,
                     upper=2 * np.pi,
                 ),
-                axis=Axis((1.0, 0.0, 0.0)),
+                axis=make_axis((1.0, 0.0, 0.0)),
                 # dynamics=JointDynamics(damping=0.1, friction=0.1),
                 mimic=mimic,
             ),
@@ -314,7 +343,7 @@ def get_robot_joint(
                     lower=-2 * np.pi,
                     upper=2 * np.pi,
                 ),
-                axis=Axis((0.0, 1.0, 0.0)),
+                axis=make_axis((0.0, 1.0, 0.0)),
                 # dynamics=JointDynamics(damping=0.1, friction=0.1),
                 mimic=mimic,
             ),
@@ -329,7 +358,7 @@ def get_robot_joint(
                     lower=-2 * np.pi,
                     upper=2 * np.pi,
                 ),
-                axis=Axis((0.0, 0.0, -1.0)),
+                axis=make_axis((0.0, 0.0, -1.0)),
                 # dynamics=JointDynamics(damping=0.1, friction=0.1),
                 mimic=mimic,
             ),
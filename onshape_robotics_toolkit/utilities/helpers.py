@@ -4,7 +4,9 @@ This module contains utility functions used across the Onshape API package.
 Functions:
     - **xml_escape**: Escape XML characters in a string.
     - **format_number**: Format a number to 8 significant figures.
+    - **load_model_from_json**: Load a Pydantic model from a JSON file.
     - **generate_uid**: Generate a 16-character unique identifier from a list of strings.
+    - **generate_uid_str**: Generate the same identifier as `generate_uid` from strings passed as arguments.
     - **print_dict**: Print a dictionary with indentation for nested dictionaries.
     - **get_random_files**: Get random files from a directory with a specific file extension and count.
     - **get_random_names**: Generate random names from a list of words in a file.
@@ -15,6 +17,7 @@ import json
 import os
 import random
 import re
+from typing import TypeVar
 from xml.sax.saxutils import escape
 
 import dotenv
@@ -26,13 +29,19 @@ from pydantic import BaseModel
 
 from onshape_robotics_toolkit.log import LOGGER
 
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# Values that dominate exported models (zero offsets, unit axes, default multipliers), pre-formatted for format_number
+_FORMATTED_NUMBERS = {0.0: "0", 1.0: "1", -1.0: "-1", 0.5: "0.5", -0.5: "-0.5"}
+
+# Empty SHA-256 state that `generate_uid_str` copies instead of constructing a new hash object per call
+_SHA256_BASE = hashlib.sha256()
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, np.ndarray):
             return obj.tolist()  # Convert numpy array to list
-        if isinstance(obj, np.matrix):
-            return obj.tolist()  # Convert numpy matrix to list
         if isinstance(obj, set):
             return list(obj)  # Convert set to list
         return super().default(obj)
@@ -75,6 +84,28 @@ def save_model_as_json(model: BaseModel, file_path: str, indent: int = 4) -> Non
         json.dump(model.model_dump(), file, indent=indent, cls=CustomJSONEncoder)
 
 
+def load_model_from_json(model: type[ModelType], file_path: str) -> ModelType:
+    """
+    Load a Pydantic model from a JSON file, e.g. one written by `save_model_as_json`
+
+    The raw bytes are handed straight to Pydantic's compiled JSON parser, which skips building an intermediate
+    Python dictionary with `json.load` before validating it.
+
+    Args:
+        model (type[BaseModel]): Pydantic model class to load
+        file_path (str): File path of the JSON file
+
+    Returns:
+        BaseModel: Instance of the Pydantic model
+
+    Examples:
+        >>> assembly = load_model_from_json(Assembly, "quadruped.json")
+    """
+
+    with open(file_path, "rb") as file:
+        return model.model_validate_json(file.read())
+
+
 def xml_escape(unescaped: str) -> str:
     """
     Escape XML characters in a string
@@ -112,8 +143,17 @@ def format_number(value: float) -> str:
 
         >>> format_number(123456789)
         "123456789"
+
+        >>> format_number(-0.0)
+        "0"
     """
 
+    # Only floats go through the table, other numerics such as 0-d numpy arrays are not hashable
+    if isinstance(value, float):
+        formatted = _FORMATTED_NUMBERS.get(value)
+        if formatted is not None:
+            return formatted
+
     return f"{value:.8g}"
 
 
@@ -132,8 +172,31 @@ def generate_uid(values: list[str]) -> str:
         "c4ca4238a0b92382"
     """
 
-    _value = "".join(values)
-    return hashlib.sha256(_value.encode()).hexdigest()[:16]
+    return generate_uid_str(*values)
+
+
+def generate_uid_str(*values: str) -> str:
+    """
+    Generate a 16-character unique identifier from strings passed as arguments, the result is identical to
+    `generate_uid` on a list of the same strings
+
+    Each string is fed to the hash in turn, so no intermediate list or concatenated string is built
+
+    Args:
+        *values (str): Strings to concatenate
+
+    Returns:
+        str: Unique identifier
+
+    Examples:
+        >>> generate_uid_str("hello", "world") == generate_uid(["hello", "world"])
+        True
+    """
+    _hash = _SHA256_BASE.copy()
+    for value in values:
+        _hash.update(value.encode())
+
+    return _hash.hexdigest()[:16]
 
 
 def print_dict(d: dict, indent=0) -> None:
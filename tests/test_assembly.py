@@ -0,0 +1,258 @@
+import json
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+
+from onshape_robotics_toolkit.models.assembly import (
+    Assembly,
+    AssemblyFeatureType,
+    MatedCS,
+    MateFeatureData,
+    MateRelationFeatureData,
+    MateType,
+    Part,
+)
+from onshape_robotics_toolkit.models.element import Element, ElementType, decode_elements
+from onshape_robotics_toolkit.models.mass import MassProperties, PrincipalAxis
+from onshape_robotics_toolkit.urdf import get_joint_mimic
+from onshape_robotics_toolkit.utilities.helpers import load_model_from_json, save_model_as_json
+
+DID = "a1c1addf75444f54b504f25c"
+EID = "0b0c209535554345432581fe"
+MVID = "349f6413cafefe8fb4ab3b07"
+
+IDS = {
+    "fullConfiguration": "default",
+    "configuration": "default",
+    "documentId": DID,
+    "elementId": EID,
+    "documentMicroversion": MVID,
+}
+MATED_CS = {"xAxis": [1.0, 0.0, 0.0], "yAxis": [0.0, 1.0, 0.0], "zAxis": [0.0, 0.0, 1.0], "origin": [0.0, 0.0, 0.1]}
+IDENTITY = np.eye(4).flatten().tolist()
+
+
+def part_instance(index: int) -> dict:
+    return {
+        **IDS,
+        "id": f"P{index}",
+        "name": f"part {index}",
+        "type": "Part",
+        "suppressed": False,
+        "isStandardContent": False,
+        "partId": "JHD",
+    }
+
+
+ASSEMBLY = {
+    "rootAssembly": {
+        **IDS,
+        "instances": [
+            part_instance(0),
+            part_instance(1),
+            {**IDS, "id": "A0", "name": "sub", "type": "Assembly", "suppressed": False},
+        ],
+        "patterns": [],
+        "features": [
+            {
+                "id": "F1",
+                "suppressed": False,
+                "featureType": "mate",
+                "featureData": {
+                    "name": "Revolute 1",
+                    "mateType": "REVOLUTE",
+                    "matedEntities": [
+                        {"matedOccurrence": ["P0"], "matedCS": MATED_CS},
+                        {"matedOccurrence": ["P1"], "matedCS": MATED_CS},
+                    ],
+                },
+            },
+            {
+                "id": "F2",
+                "suppressed": False,
+                "featureType": "mateRelation",
+                "featureData": {
+                    "name": "Gear 1",
+                    "relationType": "GEAR",
+                    "mates": [{"featureId": "F1", "occurrence": []}],
+                    "reverseDirection": False,
+                    "relationRatio": 2.0,
+                },
+            },
+        ],
+        "occurrences": [
+            {"path": ["P0"], "transform": IDENTITY, "fixed": True, "hidden": False},
+            {"path": ["P1"], "transform": IDENTITY, "fixed": False, "hidden": False},
+        ],
+    },
+    "subAssemblies": [{**IDS, "instances": [part_instance(2)], "patterns": [], "features": []}],
+    "parts": [{**IDS, "partId": "JHD", "bodyType": "solid", "isStandardContent": False}],
+    "partStudioFeatures": [],
+}
+
+ELEMENTS = [
+    {"id": EID, "name": "wheelAndFork", "elementType": "PARTSTUDIO", "microversionId": MVID, "type": "Part Studio"},
+    {"id": "1a44468a497fb472bc80d884", "name": "ballbot", "elementType": "ASSEMBLY", "microversionId": MVID},
+]
+
+
+@pytest.fixture(scope="module")
+def assembly() -> Assembly:
+    return Assembly.model_validate_json(json.dumps(ASSEMBLY))
+
+
+def make_tfs(count: int) -> np.ndarray:
+    tfs = np.tile(np.eye(4), (count, 1, 1))
+    tfs[:, :3, :3] = Rotation.from_euler("xyz", np.linspace(-1.0, 1.0, 3 * count).reshape(count, 3)).as_matrix()
+    tfs[:, :3, 3] = np.arange(3 * count).reshape(count, 3)
+    return tfs
+
+
+def test_build_index(assembly: Assembly):
+    assert list(assembly.occurrence_by_path) == [("P0",), ("P1",)]
+    assert assembly.occurrence_by_path[("P0",)].fixed
+
+    assert list(assembly.mate_by_feature_id) == ["F1"]
+    mate = assembly.mate_by_feature_id["F1"]
+    assert isinstance(mate, MateFeatureData)
+    assert mate.mateType == MateType.REVOLUTE
+    assert mate.id == "F1"
+
+
+def make_relation(relation_type: str, **values: float) -> MateRelationFeatureData:
+    return MateRelationFeatureData(
+        relationType=relation_type,
+        mates=[{"featureId": "F1", "occurrence": []}],
+        reverseDirection=False,
+        name=f"{relation_type} 1",
+        **values,
+    )
+
+
+def test_relation_ratios(assembly: Assembly):
+    np.testing.assert_array_equal(assembly.relation_ratios(), [2.0])
+
+    relation = make_relation("SCREW", relationLength=0.01)
+    assert relation.has_length
+    assert not relation.has_ratio
+    assert np.isnan(relation.relationRatio)
+
+
+@pytest.mark.parametrize(
+    "relation, multiplier",
+    [
+        (make_relation("GEAR", relationRatio=2.0), 2.0),
+        (make_relation("RACK_AND_PINION", relationLength=0.05), 0.05),
+        (make_relation("SCREW", relationLength=0.01), 0.01),
+        (make_relation("LINEAR", relationRatio=None), None),
+    ],
+)
+def test_get_joint_mimic(assembly: Assembly, relation: MateRelationFeatureData, multiplier):
+    joint_mimic = get_joint_mimic(relation, {"revolute_1": assembly.mate_by_feature_id["F1"]})
+
+    if multiplier is None:
+        assert joint_mimic is None
+    else:
+        assert joint_mimic.joint == "revolute_1"
+        assert joint_mimic.multiplier == multiplier
+
+
+def test_feature_types(assembly: Assembly):
+    feature_types = [feature.featureType for feature in assembly.rootAssembly.features]
+    assert feature_types == [AssemblyFeatureType.MATE, AssemblyFeatureType.MATERELATION]
+
+
+def test_feature_data_id_from_model(assembly: Assembly):
+    feature = assembly.rootAssembly.features[0]
+    copy = type(feature).model_validate({**feature.model_dump(), "id": "F9", "featureData": feature.featureData})
+
+    assert copy.featureData.id == "F9"
+    assert feature.featureData.id == "F1"
+
+
+def test_instances():
+    root = Assembly.model_validate_json(json.dumps(ASSEMBLY)).rootAssembly
+    assert [instance.id for instance in root.part_instances] == ["P0", "P1"]
+    assert [instance.id for instance in root.assembly_instances] == ["A0"]
+
+    root.instances = root.instances[1:]
+    assert [instance.id for instance in root.part_instances] == ["P1"]
+
+
+def test_from_tf_batch():
+    tfs = make_tfs(5)
+    mated_cs = MatedCS.from_tf_batch(tfs)
+
+    assert [cs.xAxis for cs in mated_cs] == tfs[:, :3, 0].tolist()
+    assert [cs.origin for cs in mated_cs] == tfs[:, :3, 3].tolist()
+    np.testing.assert_array_equal(MatedCS.from_tf_batch(tfs.reshape(5, 16))[2].part_to_mate_tf, tfs[2])
+
+    for cs, tf in zip(mated_cs, tfs):
+        np.testing.assert_array_equal(cs.part_to_mate_tf, tf)
+        np.testing.assert_array_equal(MatedCS.from_tf(tf).part_to_mate_tf, tf)
+
+
+def test_to_tf_batch():
+    tfs = make_tfs(5)
+    mated_cs = [MatedCS(xAxis=tf[:3, 0], yAxis=tf[:3, 1], zAxis=tf[:3, 2], origin=tf[:3, 3]) for tf in tfs]
+
+    np.testing.assert_array_equal(MatedCS.to_tf_batch(mated_cs), tfs)
+    np.testing.assert_array_equal(MatedCS.to_tf_batch(mated_cs)[1], mated_cs[1].part_to_mate_tf)
+    assert MatedCS.to_tf_batch([]).shape == (0, 4, 4)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 6])
+def test_compose_chain(count):
+    tfs = list(make_tfs(count))
+
+    expected = np.eye(4)
+    for tf in tfs:
+        expected = expected @ tf
+
+    np.testing.assert_allclose(MatedCS.compose_chain(tfs), expected, atol=1e-12)
+
+
+def test_decode_elements():
+    elements = decode_elements(json.dumps(ELEMENTS).encode())
+
+    assert elements == [Element.model_validate(element) for element in ELEMENTS]
+    assert [element.elementType for element in elements] == [ElementType.PARTSTUDIO, ElementType.ASSEMBLY]
+
+
+def test_element_to_nt():
+    element = Element.model_validate(ELEMENTS[0])
+    nt = element.to_nt()
+
+    assert nt == (EID, "wheelAndFork", ElementType.PARTSTUDIO, MVID)
+    assert Element.from_nt(nt) == element
+
+
+def test_load_model_from_json(assembly: Assembly, tmp_path):
+    file_name = str(tmp_path / "assembly.json")
+    save_model_as_json(assembly, file_name)
+    loaded = load_model_from_json(Assembly, file_name)
+
+    assert list(loaded.occurrence_by_path) == list(assembly.occurrence_by_path)
+    # Compared as JSON since the NaN fields of mate relations never compare equal
+    assert loaded.rootAssembly.model_dump_json() == assembly.rootAssembly.model_dump_json()
+
+
+def test_part_mass_property(tmp_path):
+    part = Part.model_validate(ASSEMBLY["parts"][0])
+    part.MassProperty = MassProperties(
+        volume=[1.0, 1.0, 1.0],
+        mass=[2.0, 2.0, 2.0],
+        centroid=[0.1, 0.2, 0.3, 0.0],
+        inertia=[1.0, 0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 3.0, 0.0],
+        principalInertia=[1.0, 2.0, 3.0],
+        principalAxes=[PrincipalAxis(x=1, y=0, z=0), PrincipalAxis(x=0, y=1, z=0), PrincipalAxis(x=0, y=0, z=1)],
+    )
+    assert part.model_dump()["MassProperty"]["mass"] == [2.0, 2.0, 2.0]
+
+    file_name = str(tmp_path / "part.json")
+    save_model_as_json(part, file_name)
+    loaded = load_model_from_json(Part, file_name)
+
+    assert loaded.MassProperty == part.MassProperty
+    assert loaded.partId == part.partId
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from onshape_robotics_toolkit.utilities.helpers import format_number
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0.0, "0"),
+        (-0.0, "0"),
+        (1.0, "1"),
+        (-0.5, "-0.5"),
+        (0.123456789, "0.12345679"),
+        (12345678, "12345678"),
+        (1, "1"),
+        (np.float64(0.5), "0.5"),
+        (np.float32(0.25), "0.25"),
+        (np.array(0.5), "0.5"),
+        (np.array(0.123456789), "0.12345679"),
+    ],
+)
+def test_format_number(value, expected):
+    assert format_number(value) == expected
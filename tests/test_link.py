@@ -0,0 +1,123 @@
+import lxml.etree as ET
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+
+from onshape_robotics_toolkit.models.geometry import BoxGeometry
+from onshape_robotics_toolkit.models.link import (
+    CollisionLink,
+    InertialLink,
+    Link,
+    Material,
+    Origin,
+    VisualLink,
+    transform_origins,
+)
+
+RPYS = [
+    (0.0, 0.0, 0.0),
+    (0.1, -0.2, 0.3),
+    (np.pi / 2, 0.0, 0.0),
+    (-2.5, 1.2, 3.0),
+    # Gimbal lock, where the yaw is folded into the roll
+    (0.3, np.pi / 2, 0.0),
+    (0.3, -np.pi / 2, 0.0),
+]
+
+
+def make_matrix(rpy: tuple[float, float, float], xyz: tuple[float, float, float]) -> np.ndarray:
+    matrix = np.eye(4)
+    matrix[:3, :3] = Rotation.from_euler("xyz", rpy).as_matrix()
+    matrix[:3, 3] = xyz
+    return matrix
+
+
+def make_box_elements(count: int) -> list[ET.Element]:
+    return [ET.fromstring(f'<geometry><box size="{i} {i + 0.5} {2 * i}"/></geometry>') for i in range(count)]
+
+
+@pytest.mark.filterwarnings("ignore:Gimbal lock detected")
+@pytest.mark.parametrize("rpy", RPYS)
+def test_origin_from_matrix(rpy):
+    matrix = make_matrix(rpy, (1.0, 2.0, 3.0))
+    origin = Origin.from_matrix(matrix)
+
+    assert origin.xyz == (1.0, 2.0, 3.0)
+    np.testing.assert_allclose(origin.rpy, Rotation.from_matrix(matrix[:3, :3]).as_euler("xyz"), atol=1e-12)
+
+
+@pytest.mark.parametrize("rpy", RPYS)
+def test_origin_quat(rpy):
+    origin = Origin(xyz=(0.0, 0.0, 0.0), rpy=rpy)
+
+    np.testing.assert_allclose(origin.quat(), Rotation.from_euler("xyz", rpy).as_quat(), atol=1e-12)
+    np.testing.assert_allclose(origin.quat("zyx"), Rotation.from_euler("zyx", rpy).as_quat(), atol=1e-12)
+
+
+@pytest.mark.parametrize("rpy", RPYS)
+def test_origin_transform(rpy):
+    origin = Origin(xyz=(0.5, -1.0, 2.0), rpy=(0.2, 0.1, -0.4))
+    matrix = make_matrix(rpy, (1.0, 2.0, 3.0))
+
+    expected = matrix @ make_matrix(origin.rpy, origin.xyz)
+    transformed = origin.transform(matrix)
+
+    np.testing.assert_allclose(make_matrix(transformed.rpy, transformed.xyz), expected, atol=1e-12)
+
+    assert origin.transform(matrix, inplace=True) is None
+    assert origin == transformed
+
+
+def test_transform_origins():
+    origins = [Origin(xyz=(float(i), 0.5 * i, -1.0), rpy=(0.1 * i, -0.2, 0.05 * i)) for i in range(5)]
+    matrix = make_matrix((0.3, -0.7, 1.1), (1.0, 2.0, 3.0))
+    expected = [origin.transform(matrix) for origin in origins]
+
+    transform_origins(origins, matrix)
+
+    for origin, expected_origin in zip(origins, expected):
+        np.testing.assert_allclose(origin.xyz, expected_origin.xyz, atol=1e-12)
+        np.testing.assert_allclose(origin.rpy, expected_origin.rpy, atol=1e-12)
+
+    transform_origins([], matrix)
+
+
+@pytest.mark.parametrize("count", [1, 64, 65, 200])
+def test_box_from_xml_batch(count):
+    elements = make_box_elements(count)
+
+    assert BoxGeometry.from_xml_batch(elements) == [BoxGeometry.from_xml(element) for element in elements]
+
+
+@pytest.mark.parametrize("count", [1, 200])
+@pytest.mark.parametrize("size", ["1 2", "1 2 3 4"])
+def test_box_from_xml_batch_invalid_size(count, size):
+    elements = make_box_elements(count)
+    elements[-1].find("box").set("size", size)
+
+    with pytest.raises(ValueError):
+        BoxGeometry.from_xml_batch(elements)
+
+
+def test_link_to_xml_bytes():
+    origin = Origin(xyz=(0.1, 0.2, 0.3), rpy=(0.0, 0.5, 0.0))
+    geometry = BoxGeometry((1.0, 2.0, 3.0))
+    link = Link(
+        name='base "link" & <co>',
+        visual=VisualLink(
+            name="base_visual",
+            origin=origin,
+            geometry=geometry,
+            material=Material.from_color(name="red", color=(1.0, 0.0, 0.0, 1.0)),
+        ),
+        collision=CollisionLink(name="base_collision", origin=origin, geometry=geometry),
+        inertial=InertialLink.from_xml(
+            ET.fromstring(
+                '<inertial><origin xyz="0 0 0" rpy="0 0 0"/><mass value="1.5"/>'
+                '<inertia ixx="1" iyy="2" izz="3" ixy="0" ixz="0" iyz="0"/></inertial>'
+            )
+        ),
+    )
+
+    assert link.to_xml_bytes() == ET.tostring(link.to_xml())
+    assert Link(name="empty").to_xml_bytes() == ET.tostring(Link(name="empty").to_xml())
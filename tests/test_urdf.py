@@ -0,0 +1,172 @@
+import lxml.etree as ET
+import pytest
+
+from onshape_robotics_toolkit.models.geometry import BoxGeometry, CylinderGeometry
+from onshape_robotics_toolkit.models.joint import (
+    FixedJoint,
+    JointDynamics,
+    JointLimits,
+    PlanarJoint,
+    PrismaticJoint,
+    RevoluteJoint,
+)
+from onshape_robotics_toolkit.models.link import Axis, Origin
+from onshape_robotics_toolkit.robot import Robot, RobotType, iter_urdf_elements, set_joint_from_xml
+
+URDF = """<?xml version="1.0"?>
+<!-- generated -->
+<robot name="bot">
+  <!-- links and joints -->
+  <link name="base">
+    <inertial>
+      <origin xyz="0 0 0" rpy="0 0 0"/>
+      <mass value="1"/>
+      <inertia ixx="1" iyy="1" izz="1" ixy="0" ixz="0" iyz="0"/>
+    </inertial>
+  </link>
+  <link name="l1">
+    <visual name="l1_visual">
+      <origin xyz="0 0 0.5" rpy="0 0 0"/>
+      <geometry><box size="0.1 0.2 0.3"/></geometry>
+      <material name="red"><color rgba="1 0 0 1"/></material>
+    </visual>
+    <collision name="l1_collision">
+      <origin xyz="0 0 0.5" rpy="0 0 0"/>
+      <geometry><cylinder radius="0.05" length="0.4"/></geometry>
+    </collision>
+  </link>
+  <joint name="j1" type="revolute">
+    <origin xyz="0 0 1" rpy="0 0 0"/>
+    <parent link="base"/>
+    <child link="l1"/>
+    <axis xyz="0 0 1"/>
+    <limit effort="1" velocity="2" lower="-1" upper="1"/>
+    <dynamics damping="0.25" friction="0.5"/>
+  </joint>
+  <transmission name="t1">
+    <joint name="j1"><hardwareInterface>EffortJointInterface</hardwareInterface></joint>
+  </transmission>
+  <link name="l2"/>
+  <joint name="j2" type="fixed">
+    <origin xyz="1 0 0" rpy="0 0 0"/>
+    <parent link="l1"/>
+    <child link="l2"/>
+  </joint>
+  <link name="l3"/>
+  <joint name="j3" type="planar">
+    <origin xyz="0 1 0" rpy="0 0 0"/>
+    <parent link="l2"/>
+    <child link="l3"/>
+    <axis xyz="0 0 1"/>
+    <limit effort="3" velocity="4" lower="-0.5" upper="0.5"/>
+  </joint>
+</robot>
+"""
+
+ORIGIN = Origin(xyz=(0.1, -0.2, 0.3), rpy=(0.4, -0.5, 0.6))
+
+JOINTS = [
+    FixedJoint(name="fixed", parent="base", child="l1", origin=ORIGIN),
+    RevoluteJoint(
+        name="revolute",
+        parent="base",
+        child="l2",
+        origin=ORIGIN,
+        limits=JointLimits(effort=1.0, velocity=2.0, lower=-1.0, upper=1.0),
+        axis=Axis((0.0, 0.0, 1.0)),
+        dynamics=JointDynamics(damping=0.1, friction=0.2),
+    ),
+    PrismaticJoint(
+        name='with "quotes" & <chars>',
+        parent="l1",
+        child="l3",
+        origin=ORIGIN,
+        limits=JointLimits(effort=1.0, velocity=2.0, lower=0.0, upper=0.5),
+        axis=Axis((1.0, 0.0, 0.0)),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def urdf_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    file_name = tmp_path_factory.mktemp("urdf") / "bot.urdf"
+    file_name.write_text(URDF)
+    return str(file_name)
+
+
+def test_iter_urdf_elements(urdf_file: str):
+    elements = iter_urdf_elements(urdf_file)
+    root = next(elements)
+
+    assert root.tag == "robot"
+    assert root.attrib["name"] == "bot"
+
+    # The joint nested in the transmission is not yielded as a top-level joint
+    tags = [(element.tag, element.attrib["name"]) for element in elements]
+    assert tags == [
+        ("link", "base"),
+        ("link", "l1"),
+        ("joint", "j1"),
+        ("link", "l2"),
+        ("joint", "j2"),
+        ("link", "l3"),
+        ("joint", "j3"),
+    ]
+
+
+def test_from_urdf(urdf_file: str):
+    robot = Robot.from_urdf(urdf_file, RobotType.URDF)
+
+    assert robot.name == "bot"
+    assert list(robot.graph.nodes) == ["base", "l1", "l2", "l3"]
+
+    link = robot.graph.nodes["l1"]["data"]
+    assert link.visual.geometry == BoxGeometry((0.1, 0.2, 0.3))
+    assert link.collision.geometry == CylinderGeometry(radius=0.05, length=0.4)
+
+    joints = {joint.name: joint for _, _, joint in robot.graph.edges(data="data")}
+    assert set(joints) == {"j1", "j2", "j3"}
+    assert isinstance(joints["j1"], RevoluteJoint)
+    assert joints["j1"].limits == JointLimits(effort=1.0, velocity=2.0, lower=-1.0, upper=1.0)
+    assert joints["j1"].dynamics == JointDynamics(damping=0.25, friction=0.5)
+    assert isinstance(joints["j2"], FixedJoint)
+    assert (joints["j2"].parent, joints["j2"].child) == ("l1", "l2")
+    assert isinstance(joints["j3"], PlanarJoint)
+    assert joints["j3"].limits == JointLimits(effort=3.0, velocity=4.0, lower=-0.5, upper=0.5)
+    assert joints["j3"].axis == Axis((0.0, 0.0, 1.0))
+
+
+def test_set_joint_from_xml_unknown_type():
+    element = ET.fromstring(
+        '<joint name="j" type="spherical"><origin xyz="0 0 0" rpy="0 0 0"/><parent link="a"/><child link="b"/></joint>'
+    )
+    assert set_joint_from_xml(element) is None
+
+
+def test_urdf_round_trip(urdf_file: str, tmp_path):
+    robot = Robot.from_urdf(urdf_file, RobotType.URDF)
+
+    file_name = tmp_path / "round_trip.urdf"
+    file_name.write_text(robot.to_urdf())
+    round_trip = Robot.from_urdf(str(file_name), RobotType.URDF)
+
+    assert list(round_trip.graph.nodes) == list(robot.graph.nodes)
+    assert list(round_trip.graph.edges(data="data")) == list(robot.graph.edges(data="data"))
+
+
+@pytest.mark.parametrize("joint", JOINTS, ids=lambda joint: joint.joint_type)
+def test_joint_to_xml_fast(joint):
+    assert ET.tostring(joint.to_xml_fast()) == ET.tostring(joint.to_xml())
+
+    root = ET.Element("robot")
+    assert joint.to_xml_fast(root) is root[0]
+
+
+@pytest.mark.parametrize("joint", JOINTS, ids=lambda joint: joint.joint_type)
+def test_joint_to_xml_stream(joint, tmp_path):
+    file_name = tmp_path / "joint.urdf"
+    with ET.xmlfile(str(file_name), encoding="utf-8") as xf, xf.element("robot", name="bot"):
+        joint.to_xml_stream(xf)
+
+    streamed = ET.parse(str(file_name)).getroot()[0]
+    assert ET.tostring(streamed) == ET.tostring(joint.to_xml())